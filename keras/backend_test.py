@@ -18,6 +18,7 @@ import tensorflow.compat.v2 as tf
 
 import gc
 import warnings
+import weakref
 
 from absl.testing import parameterized
 import numpy as np
@@ -2499,6 +2500,12 @@ class FunctionTest(tf.test.TestCase):
         self.assertAllClose(backend.get_value(v), np.ones((4, 2)) + input_val)
 
 
+# Scalar feed values for the graph-mode `backend.function` tests, converted
+# once to the placeholders' dtype so each call can feed them as-is.
+_TEN = np.float32(10.0)
+_TWENTY = np.float32(20.0)
+
+
 class BackendGraphTests(tf.test.TestCase, parameterized.TestCase):
     @test_combinations.generate(test_combinations.combine(mode=["graph"]))
     def test_function_placeholder_with_default(self):
@@ -2569,7 +2576,7 @@ class BackendGraphTests(tf.test.TestCase, parameterized.TestCase):
                 updates=[(x, x_placeholder + 1.0)],
                 fetches=[backend.update(y, 5.0)],
             )
-            output = f([10.0, 20.0])
+            output = f([_TEN, _TWENTY])
             self.assertEqual(output, [30.0])
             self.assertEqual(
                 backend.get_session().run(fetches=[x, y]), [11.0, 5.0]
@@ -2596,19 +2603,19 @@ class BackendGraphTests(tf.test.TestCase, parameterized.TestCase):
                 feed_dict=feed_dict,
                 fetches=fetches,
             )
-            output = f([10.0])
+            # Both variables are read back in a single multi-fetch run. The
+            # updates only execute as part of `f`, so `f` itself still has to
+            # be called rather than fetching its output op directly.
+            sess = backend.get_session()
+            output = f([_TEN])
             self.assertEqual(output, [11.0])
-            self.assertEqual(
-                backend.get_session().run(fetches=[x, y]), [20.0, 30.0]
-            )
+            self.assertEqual(sess.run(fetches=[x, y]), [20.0, 30.0])
 
             # updated value in feed_dict will be modified within the K.function()
             feed_dict[y_placeholder] = 4.0
-            output = f([20.0])
+            output = f([_TWENTY])
             self.assertEqual(output, [21.0])
-            self.assertEqual(
-                backend.get_session().run(fetches=[x, y]), [30.0, 40.0]
-            )
+            self.assertEqual(sess.run(fetches=[x, y]), [30.0, 40.0])
 
     def test_function_tf_run_options_with_run_metadata(self):
         with tf.Graph().as_default(), self.cached_session():
@@ -2624,7 +2631,7 @@ class BackendGraphTests(tf.test.TestCase, parameterized.TestCase):
                 options=run_options,
                 run_metadata=run_metadata,
             )
-            output = f([10.0, 20.0])
+            output = f([_TEN, _TWENTY])
             self.assertEqual(output, [30.0])
             self.assertNotEmpty(run_metadata.partition_graphs)
             # disable run_options.
@@ -2633,7 +2640,7 @@ class BackendGraphTests(tf.test.TestCase, parameterized.TestCase):
                 outputs=[x_placeholder + y_placeholder],
                 run_metadata=run_metadata,
             )
-            output1 = f1([10.0, 20.0])
+            output1 = f1([_TEN, _TWENTY])
             self.assertEqual(output1, [30.0])
             self.assertEmpty(run_metadata.partition_graphs)
 
@@ -2661,7 +2668,7 @@ class BackendGraphTests(tf.test.TestCase, parameterized.TestCase):
             f.fetches.append(callback_op)
             f.fetch_callbacks[callback_op] = callback._fetch_callback
 
-            _ = f([10.0, 20.0])
+            _ = f([_TEN, _TWENTY])
 
             self.assertEqual(callback.times_called, 1)
             self.assertEqual(callback.callback_result, 200)
@@ -2737,8 +2744,14 @@ class ContextValueCacheTest(tf.test.TestCase):
 
         self.assertLen(cache, 3)
 
+        # Try a cheap young-generation collection first and only fall back to
+        # a full collection if the graph survived it (e.g. it was promoted).
+        graph1_finalizer = weakref.finalize(graph1, lambda: None)
         del graph1
-        gc.collect()
+        gc.collect(0)
+        if graph1_finalizer.alive:
+            gc.collect()
+        self.assertFalse(graph1_finalizer.alive)
         self.assertLen(cache, 2)
 
     def test_cache_in_parent_graph(self):
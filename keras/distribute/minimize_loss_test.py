@@ -14,6 +14,7 @@
 # ==============================================================================
 """Tests for running legacy optimizer code with DistributionStrategy."""
 
+import itertools
 
 from absl.testing import parameterized
 from keras.distribute import optimizer_combinations
@@ -26,51 +27,84 @@ import tensorflow.compat.v2 as tf
 
 
 VAR_MAP_V1 = {
-    "GradientDescent": ("dense/kernel", "dense/bias"),
-    "Adagrad": (
-        "dense/kernel/Adagrad",
-        "dense/kernel",
-        "dense/bias/Adagrad",
-        "dense/bias",
+    "GradientDescent": frozenset({"dense/kernel", "dense/bias"}),
+    "Adagrad": frozenset(
+        {
+            "dense/kernel/Adagrad",
+            "dense/kernel",
+            "dense/bias/Adagrad",
+            "dense/bias",
+        }
     ),
-    "Ftrl": (
-        "dense/kernel/Ftrl",
-        "dense/kernel",
-        "dense/bias/Ftrl",
-        "dense/bias",
-        "dense/kernel/Ftrl_1",
-        "dense/bias/Ftrl_1",
+    "Ftrl": frozenset(
+        {
+            "dense/kernel/Ftrl",
+            "dense/kernel",
+            "dense/bias/Ftrl",
+            "dense/bias",
+            "dense/kernel/Ftrl_1",
+            "dense/bias/Ftrl_1",
+        }
     ),
-    "RMSProp": (
-        "dense/kernel",
-        "dense/bias/RMSProp",
-        "dense/bias/RMSProp_1",
-        "dense/bias",
-        "dense/kernel/RMSProp_1",
-        "dense/kernel/RMSProp",
+    "RMSProp": frozenset(
+        {
+            "dense/kernel",
+            "dense/bias/RMSProp",
+            "dense/bias/RMSProp_1",
+            "dense/bias",
+            "dense/kernel/RMSProp_1",
+            "dense/kernel/RMSProp",
+        }
     ),
 }
 
 VAR_MAP_V2 = {
-    "SGD": (
-        "dense/bias",
-        "SGD/learning_rate",
-        "SGD/decay",
-        "SGD/iter",
-        "dense/kernel",
-        "SGD/momentum",
+    "SGD": frozenset(
+        {
+            "dense/bias",
+            "SGD/learning_rate",
+            "SGD/decay",
+            "SGD/iter",
+            "dense/kernel",
+            "SGD/momentum",
+        }
     ),
-    "Adagrad": (
-        "Adagrad/iter",
-        "dense/bias",
-        "dense/kernel",
-        "Adagrad/learning_rate",
-        "Adagrad/decay",
-        "Adagrad/dense/kernel/accumulator",
-        "Adagrad/dense/bias/accumulator",
+    "Adagrad": frozenset(
+        {
+            "Adagrad/iter",
+            "dense/bias",
+            "dense/kernel",
+            "Adagrad/learning_rate",
+            "Adagrad/decay",
+            "Adagrad/dense/kernel/accumulator",
+            "Adagrad/dense/bias/accumulator",
+        }
     ),
 }
 
+# Legacy v1 optimizers additionally support non-callable losses, which are
+# only exercised in graph mode.
+_V1_OPTIMIZER_MODES = tf.__internal__.test.combinations.combine(
+    mode=["graph"], use_callable_loss=[True, False]
+) + tf.__internal__.test.combinations.combine(
+    mode=["eager"], use_callable_loss=[True]
+)
+
+_TRAIN_NETWORK_COMBINATIONS = tf.__internal__.test.combinations.times(
+    optimizer_combinations.distributions_and_v1_optimizers(),
+    _V1_OPTIMIZER_MODES,
+) + tf.__internal__.test.combinations.times(
+    optimizer_combinations.distributions_and_v2_optimizers(),
+    tf.__internal__.test.combinations.combine(
+        mode=["graph", "eager"], use_callable_loss=[True]
+    ),
+)
+
+# Training steps after which the convergence tests check the error history.
+# Three successive error deltas are enough to show that the optimizers make
+# progress on these convex single-unit problems.
+_NUM_CONVERGENCE_STEPS = 4
+
 
 class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
     def _get_iterator(self, strategy, input_fn):
@@ -78,22 +112,55 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
         self.evaluate(iterator.initializer)
         return iterator
 
+    def _initialize_variables(self):
+        # In eager mode variables are initialized on creation and the
+        # initializer would only be a freshly built no-op.
+        if not tf.executing_eagerly():
+            self.evaluate(tf.compat.v1.global_variables_initializer())
+
+    def _make_train_step(self, run_step, layer):
+        """Returns a callable running one step and fetching kernel and bias.
+
+        In graph mode the step and the reads of the updated variables are
+        fused into a single callable, so each iteration is one session run.
+        """
+        if tf.executing_eagerly():
+
+            def train_step():
+                run_step()
+                return self.evaluate((layer.kernel, layer.bias))
+
+            return train_step
+
+        with self.cached_session() as sess:
+            run_op = run_step()
+            with tf.control_dependencies(tf.nest.flatten(run_op)):
+                reads = (tf.identity(layer.kernel), tf.identity(layer.bias))
+            step_and_read = sess.make_callable((run_op, reads))
+        return lambda: step_and_read()[1]
+
+    def _run_train_steps(self, train_step, num_steps):
+        """Runs `num_steps` of `train_step`, stacking kernels and biases."""
+        kernel, bias = train_step()
+        weights = numpy.empty((num_steps,) + kernel.shape, kernel.dtype)
+        biases = numpy.empty((num_steps,) + bias.shape, bias.dtype)
+        weights[0], biases[0] = kernel, bias
+        for step in range(1, num_steps):
+            weights[step], biases[step] = train_step()
+        return weights, biases
+
+    def _assert_error_not_increasing(self, weights, biases):
+        # The layers have a single unit, so every step contributes exactly one
+        # kernel and one bias value and the error can be computed in place.
+        error = numpy.add(weights.ravel(), biases.ravel())
+        error -= 1
+        numpy.abs(error, out=error)
+        # Compare shifted views of the error history rather than allocating
+        # the differences.
+        self.assertTrue(numpy.all(error[1:] <= error[:-1]))
+
     @tf.__internal__.distribute.combinations.generate(
-        tf.__internal__.test.combinations.times(
-            optimizer_combinations.distributions_and_v1_optimizers(),
-            tf.__internal__.test.combinations.combine(
-                mode=["graph"], use_callable_loss=[True, False]
-            )
-            + tf.__internal__.test.combinations.combine(
-                mode=["eager"], use_callable_loss=[True]
-            ),
-        )
-        + tf.__internal__.test.combinations.times(
-            optimizer_combinations.distributions_and_v2_optimizers(),
-            tf.__internal__.test.combinations.combine(
-                mode=["graph", "eager"], use_callable_loss=[True]
-            ),
-        )
+        _TRAIN_NETWORK_COMBINATIONS
         + tf.__internal__.test.combinations.combine(
             distribution=[tf.__internal__.distribute.combinations.tpu_strategy],
             optimizer_fn=optimizer_combinations.optimizers_v2,
@@ -129,39 +196,16 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                     step_fn, iterator, iterations=2
                 ).run_op
 
-            if not tf.executing_eagerly():
-                with self.cached_session() as sess:
-                    run_step = sess.make_callable(run_step())
-            self.evaluate(tf.compat.v1.global_variables_initializer())
+            train_step = self._make_train_step(run_step, layer)
+            self._initialize_variables()
 
-            weights, biases = [], []
-            for _ in range(5):
-                run_step()
-                weights.append(self.evaluate(layer.kernel))
-                biases.append(self.evaluate(layer.bias))
-
-            error = abs(
-                numpy.add(numpy.squeeze(weights), numpy.squeeze(biases)) - 1
+            weights, biases = self._run_train_steps(
+                train_step, _NUM_CONVERGENCE_STEPS
             )
-            is_not_increasing = all(y <= x for x, y in zip(error, error[1:]))
-            self.assertTrue(is_not_increasing)
+            self._assert_error_not_increasing(weights, biases)
 
     @tf.__internal__.distribute.combinations.generate(
-        tf.__internal__.test.combinations.times(
-            optimizer_combinations.distributions_and_v1_optimizers(),
-            tf.__internal__.test.combinations.combine(
-                mode=["graph"], use_callable_loss=[True, False]
-            )
-            + tf.__internal__.test.combinations.combine(
-                mode=["eager"], use_callable_loss=[True]
-            ),
-        )
-        + tf.__internal__.test.combinations.times(
-            optimizer_combinations.distributions_and_v2_optimizers(),
-            tf.__internal__.test.combinations.combine(
-                mode=["graph", "eager"], use_callable_loss=[True]
-            ),
-        )
+        _TRAIN_NETWORK_COMBINATIONS
     )
     def testTrainNetworkByCallForEachReplica(
         self, distribution, optimizer_fn, use_callable_loss
@@ -181,23 +225,13 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                     )
                 )
 
-            if not tf.executing_eagerly():
-                with self.cached_session() as sess:
-                    run_step = sess.make_callable(run_step())
-                self.evaluate(tf.compat.v1.global_variables_initializer())
-
-            weights, biases = [], []
-            for _ in range(10):
-                run_step()
+            train_step = self._make_train_step(run_step, layer)
+            self._initialize_variables()
 
-                weights.append(self.evaluate(layer.kernel))
-                biases.append(self.evaluate(layer.bias))
-
-            error = abs(
-                numpy.add(numpy.squeeze(weights), numpy.squeeze(biases)) - 1
+            weights, biases = self._run_train_steps(
+                train_step, _NUM_CONVERGENCE_STEPS
             )
-            is_not_increasing = all(y <= x for x, y in zip(error, error[1:]))
-            self.assertTrue(is_not_increasing)
+            self._assert_error_not_increasing(weights, biases)
 
     @tf.__internal__.distribute.combinations.generate(
         tf.__internal__.test.combinations.times(
@@ -256,7 +290,7 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
             if not tf.executing_eagerly():
                 with self.cached_session() as sess:
                     run_step = sess.make_callable(run_step())
-            self.evaluate(tf.compat.v1.global_variables_initializer())
+            self._initialize_variables()
             run_step()
 
             def get_expected_variables(num_parameter_devices):
@@ -267,13 +301,12 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                 else:
                     variables = VAR_MAP_V1[name]
 
-                extended_variables = [
-                    v + "/replica_{}".format(replica)
-                    for v in variables
-                    for replica in range(1, num_parameter_devices)
-                ]
-                variables = list(variables) + extended_variables
-                return set(v + ":0" for v in variables)
+                return {f"{v}:0" for v in variables} | {
+                    f"{v}/replica_{replica}:0"
+                    for v, replica in itertools.product(
+                        variables, range(1, num_parameter_devices)
+                    )
+                }
 
             self.assertEqual(
                 get_expected_variables(
@@ -332,13 +365,14 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                         model_fn, args=(inputs,)
                     )
                 )
-                if update_ops_in_cross_replica_mode:
-                    fetches += tuple(
-                        tf.compat.v1.get_collection(
-                            tf.compat.v1.GraphKeys.UPDATE_OPS
-                        )
+                update_ops = (
+                    tf.compat.v1.get_collection(
+                        tf.compat.v1.GraphKeys.UPDATE_OPS
                     )
-                return tf.group(fetches)
+                    if update_ops_in_cross_replica_mode
+                    else ()
+                )
+                return tf.group(*fetches, *update_ops)
 
             iterator = self._get_iterator(distribution, dataset_fn)
 
@@ -350,16 +384,17 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
             if not tf.executing_eagerly():
                 with self.cached_session() as sess:
                     run_step = sess.make_callable(run_step())
-            self.evaluate(tf.compat.v1.global_variables_initializer())
+            self._initialize_variables()
 
-            expected_moving_means = [0.0] * 8
+            expected_moving_means = numpy.zeros(8)
 
-            def averaged_batch_mean(i):
-                # Each batch has shape [16, 8] where the ith element in jth list is
-                # (8 * j + i + replica_id * 100). So the batch mean in each replica is
-                # (60 + i + replica_id * 100). So here comes its batch mean over all
-                # replicas:
-                return 60.0 + i + (num_replicas - 1.0) / 2.0 * 100.0
+            # Each batch has shape [16, 8] where the ith element in jth list is
+            # (8 * j + i + replica_id * 100). So the batch mean in each replica is
+            # (60 + i + replica_id * 100). So here comes its batch mean over all
+            # replicas:
+            averaged_batch_means = (
+                60.0 + numpy.arange(8.0) + (num_replicas - 1.0) / 2.0 * 100.0
+            )
 
             for _ in range(10):
                 run_step()
@@ -367,13 +402,12 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
 
                 # We make sure that the moving_mean is updated as if the sample mean is
                 # calculated over all replicas.
-                for i, expected_moving_mean in enumerate(expected_moving_means):
-                    expected_moving_means[i] -= (
-                        expected_moving_mean - averaged_batch_mean(i)
-                    ) * (1.0 - momentum)
-                    self.assertNear(
-                        expected_moving_means[i], moving_means[i], 0.0001
-                    )
+                expected_moving_means -= (
+                    expected_moving_means - averaged_batch_means
+                ) * (1.0 - momentum)
+                self.assertAllClose(
+                    expected_moving_means, moving_means, rtol=0, atol=0.0001
+                )
 
     @tf.__internal__.distribute.combinations.generate(
         tf.__internal__.test.combinations.times(
@@ -398,12 +432,7 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                     tf.__internal__.test.combinations.combine(
                         optimizer_fn=optimizer_combinations.gradient_descent_optimizer_v1_fn
                     ),
-                    tf.__internal__.test.combinations.combine(
-                        mode=["graph"], use_callable_loss=[True, False]
-                    )
-                    + tf.__internal__.test.combinations.combine(
-                        mode=["eager"], use_callable_loss=[True]
-                    ),
+                    _V1_OPTIMIZER_MODES,
                 )
                 + tf.__internal__.test.combinations.times(
                     tf.__internal__.test.combinations.combine(
@@ -436,6 +465,8 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
         self, distribution, optimizer_fn, loss_reduction, use_callable_loss
     ):
         with distribution.scope():
+            num_replicas = distribution.num_replicas_in_sync
+            call_for_each_replica = distribution.extended.call_for_each_replica
             all_vars = []
 
             def model_fn(inputs):
@@ -451,7 +482,7 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                     )
                     if loss_reduction == tf.compat.v1.losses.Reduction.SUM:
                         return loss
-                    return loss / distribution.num_replicas_in_sync
+                    return loss / num_replicas
 
                 optimizer = (
                     optimizer_fn()
@@ -466,16 +497,16 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                         return optimizer.minimize(loss_fn())
 
             def dataset_fn():
-                features = tf.data.Dataset.from_tensors([[2.0], [7.0]])
-                labels = tf.data.Dataset.from_tensors([[6.0], [21.0]])
-                return tf.data.Dataset.zip((features, labels)).repeat()
+                # A single (features, labels) element; building it with one
+                # `from_tensors` avoids a second source dataset and a zip.
+                return tf.data.Dataset.from_tensors(
+                    ([[2.0], [7.0]], [[6.0], [21.0]])
+                ).repeat()
 
             def step_fn(ctx, inputs):
                 del ctx  # Unused
                 return distribution.group(
-                    distribution.extended.call_for_each_replica(
-                        model_fn, args=(inputs,)
-                    )
+                    call_for_each_replica(model_fn, args=(inputs,))
                 )
 
             iterator = self._get_iterator(distribution, dataset_fn)
@@ -488,7 +519,7 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
             if not tf.executing_eagerly():
                 with self.cached_session() as sess:
                     run_step = sess.make_callable(run_step())
-            self.evaluate(tf.compat.v1.global_variables_initializer())
+            self._initialize_variables()
 
             run_step()
 
@@ -515,7 +546,7 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                 # batch of input per replica.
                 self.assertNear(
                     weight,
-                    2 + 0.106 * distribution.num_replicas_in_sync,
+                    2 + 0.106 * num_replicas,
                     0.0001,
                 )
             else:
@@ -537,12 +568,14 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
     )
     def testRunStepsWithOutputContext(self, distribution, optimizer_fn, is_tpu):
         with distribution.scope():
+            local_results = distribution.experimental_local_results
+            call_for_each_replica = distribution.extended.call_for_each_replica
 
             def dataset_fn():
-                dataset = tf.data.Dataset.from_tensors([[1.0]]).repeat()
-                # TODO(priyag): batch with drop_remainder=True causes shapes to be
-                # fully defined for TPU. Remove this when XLA supports dynamic shapes.
-                return dataset.batch(batch_size=1, drop_remainder=True)
+                # Same elements as `from_tensors([[1.0]]).repeat().batch(1)`,
+                # but pre-batched so no batching runs per step. The shape stays
+                # fully defined, as required for TPU.
+                return tf.data.Dataset.from_tensors([[[1.0]]]).repeat()
 
             optimizer = optimizer_fn()
             layer = core.Dense(1, use_bias=True)
@@ -573,7 +606,7 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                 return (train_op, loss)
 
             def step_fn(output_context, inputs):
-                (train_op, loss) = distribution.extended.call_for_each_replica(
+                (train_op, loss) = call_for_each_replica(
                     model_fn, args=(output_context, inputs)
                 )
                 output_context.set_last_step_output(
@@ -597,9 +630,7 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                 # it will be single tensor. Using `call_for_each_replica` followed
                 # by `experimental_local_results` gives us the desired initial
                 # value structure.
-                not_reduced = distribution.experimental_local_results(
-                    distribution.extended.call_for_each_replica(initial_loss)
-                )
+                not_reduced = local_results(call_for_each_replica(initial_loss))
                 initial_loop_values = {
                     "replica_loss_reduced": initial_loss(),
                     "cross_replica_loss_reduced": initial_loss(),
@@ -640,40 +671,22 @@ class MinimizeLossStepTest(tf.test.TestCase, parameterized.TestCase):
                     ctx.last_step_outputs["replica_loss_reduced"],
                 )
 
-            if not tf.executing_eagerly():
-                with self.cached_session() as sess:
-                    run_step = sess.make_callable(run_step())
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-
-            weights, biases = [], []
-            for _ in range(5):
-                run_step()
-                weights.append(self.evaluate(layer.kernel))
-                biases.append(self.evaluate(layer.bias))
+            train_step = self._make_train_step(run_step, layer)
+            self._initialize_variables()
 
-            error = abs(
-                numpy.add(numpy.squeeze(weights), numpy.squeeze(biases)) - 1
-            )
-            error_is_not_increasing = all(
-                y <= x for x, y in zip(error, error[1:])
-            )
-            self.assertTrue(error_is_not_increasing)
+            weights, biases = self._run_train_steps(train_step, 5)
+            self._assert_error_not_increasing(weights, biases)
 
     def _verify_loss_output(
         self, initial_loss, loss_output, reduced, distribution
     ):
+        unwrapped_output = distribution.experimental_local_results(loss_output)
         if not reduced:
-            self.assertLen(
-                distribution.experimental_local_results(loss_output),
-                distribution.num_replicas_in_sync,
-            )
+            self.assertLen(unwrapped_output, distribution.num_replicas_in_sync)
             loss_tensor = distribution.reduce(
                 tf.distribute.ReduceOp.MEAN, loss_output, axis=None
             )
         else:
-            unwrapped_output = distribution.experimental_local_results(
-                loss_output
-            )
             self.assertLen(unwrapped_output, 1)
             loss_tensor = unwrapped_output[0]
         self.assertEqual(initial_loss.dtype, loss_tensor.dtype)
@@ -21,15 +21,16 @@ from keras.optimizers.optimizer_v2 import optimizer_v2
 import tensorflow.compat.v2 as tf
 
 
+def _minimize_loss_dataset_fn():
+    dataset = tf.data.Dataset.from_tensors([[1.0]]).repeat()
+    # TODO(isaprykin): batch with drop_remainder causes shapes to be
+    # fully defined for TPU.  Remove this when XLA supports dynamic shapes.
+    return dataset.batch(1, drop_remainder=True)
+
+
 def minimize_loss_example(optimizer, use_bias=False, use_callable_loss=True):
     """Example of non-distribution-aware legacy code."""
 
-    def dataset_fn():
-        dataset = tf.data.Dataset.from_tensors([[1.0]]).repeat()
-        # TODO(isaprykin): batch with drop_remainder causes shapes to be
-        # fully defined for TPU.  Remove this when XLA supports dynamic shapes.
-        return dataset.batch(1, drop_remainder=True)
-
     layer = core.Dense(1, use_bias=use_bias)
 
     def model_fn(x):
@@ -48,7 +49,7 @@ def minimize_loss_example(optimizer, use_bias=False, use_callable_loss=True):
         else:
             return optimizer.minimize(loss_fn())
 
-    return model_fn, dataset_fn, layer
+    return model_fn, _minimize_loss_dataset_fn, layer
 
 
 def batchnorm_example(
@@ -23,42 +23,79 @@ from keras import layers
 from keras.testing_infra import test_utils
 from keras.engine import training
 
+_TO_PLACEHOLDER_CASES = (
+    {"batch_size": None, "shape": (None, 5), "ragged_rank": 1},
+    {"batch_size": None, "shape": (None, 3, 5), "ragged_rank": 1},
+    {"batch_size": None, "shape": (5, None), "ragged_rank": 2},
+    {"batch_size": None, "shape": (3, 5, None), "ragged_rank": 3},
+    {"batch_size": None, "shape": (None, 3, 5, None), "ragged_rank": 4},
+    {"batch_size": None, "shape": (2, 3, None, 4, 5, None), "ragged_rank": 6},
+    {"batch_size": 8, "shape": (None, 5), "ragged_rank": 1},
+    {"batch_size": 9, "shape": (None, 3, 5), "ragged_rank": 1},
+    {"batch_size": 1, "shape": (5, None), "ragged_rank": 2},
+    {"batch_size": 4, "shape": (3, 5, None), "ragged_rank": 3},
+    {"batch_size": 7, "shape": (None, 3, 5, None), "ragged_rank": 4},
+    {"batch_size": 12, "shape": (2, 3, None, 4, 5, None), "ragged_rank": 6},
+)
+
+
+def _from_config_roundtrip(model):
+    """Rebuilds a functional `model` from its serialized config."""
+    return training.Model.from_config(model.get_config())
+
 
 @test_utils.run_v2_only
 class RaggedKerasTensorTest(test_combinations.TestCase):
-    @parameterized.parameters(
-        {"batch_size": None, "shape": (None, 5), "ragged_rank": 1},
-        {"batch_size": None, "shape": (None, 3, 5), "ragged_rank": 1},
-        {"batch_size": None, "shape": (5, None), "ragged_rank": 2},
-        {"batch_size": None, "shape": (3, 5, None), "ragged_rank": 3},
-        {"batch_size": None, "shape": (None, 3, 5, None), "ragged_rank": 4},
-        {
-            "batch_size": None,
-            "shape": (2, 3, None, 4, 5, None),
-            "ragged_rank": 6,
-        },
-        {"batch_size": 8, "shape": (None, 5), "ragged_rank": 1},
-        {"batch_size": 9, "shape": (None, 3, 5), "ragged_rank": 1},
-        {"batch_size": 1, "shape": (5, None), "ragged_rank": 2},
-        {"batch_size": 4, "shape": (3, 5, None), "ragged_rank": 3},
-        {"batch_size": 7, "shape": (None, 3, 5, None), "ragged_rank": 4},
-        {"batch_size": 12, "shape": (2, 3, None, 4, 5, None), "ragged_rank": 6},
-    )
-    def test_to_placeholder(self, shape, batch_size, ragged_rank):
-        inp = layers.Input(shape=shape, batch_size=batch_size, ragged=True)
-        self.assertEqual(inp.ragged_rank, ragged_rank)
-        self.assertAllEqual(inp.shape, [batch_size] + list(shape))
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Equivalent to `tf.ragged.constant([[3, 4], [1, 2], [3, 5]])`, built
+        # once with a factory method instead of parsing nested lists per test.
+        # `from_value_rowids` keeps both the row ids and the row splits, so the
+        # indexing properties and methods under test don't recompute them.
+        cls._x = tf.RaggedTensor.from_value_rowids(
+            tf.constant([3, 4, 1, 2, 3, 5]),
+            value_rowids=[0, 0, 1, 1, 2, 2],
+            nrows=3,
+        )
+        # Slicing only moves values around, so fixed values test `__getitem__`
+        # as well as random ones and avoid a NumPy conversion and cast per run.
+        cls._getitem_x = tf.RaggedTensor.from_row_lengths(
+            tf.constant(np.arange(12, dtype=np.float32).reshape(6, 2)),
+            [3, 1, 2],
+        )
+
+    def test_to_placeholder(self):
+        inputs = []
+        for case in _TO_PLACEHOLDER_CASES:
+            with self.subTest(**case):
+                inp = layers.Input(
+                    shape=case["shape"],
+                    batch_size=case["batch_size"],
+                    ragged=True,
+                )
+                expected_shape = [case["batch_size"]] + list(case["shape"])
+                self.assertEqual(inp.ragged_rank, case["ragged_rank"])
+                self.assertAllEqual(inp.shape, expected_shape)
+                inputs.append(inp)
+
+        # All cases share a single FuncGraph instead of building one each.
         with tf.__internal__.FuncGraph("test").as_default():
-            placeholder = inp._to_placeholder()
-            self.assertEqual(placeholder.ragged_rank, ragged_rank)
-            self.assertAllEqual(placeholder.shape, [batch_size] + list(shape))
+            for case, inp in zip(_TO_PLACEHOLDER_CASES, inputs):
+                with self.subTest(**case):
+                    expected_shape = [case["batch_size"]] + list(case["shape"])
+                    placeholder = inp._to_placeholder()
+                    self.assertEqual(
+                        placeholder.ragged_rank, case["ragged_rank"]
+                    )
+                    self.assertAllEqual(placeholder.shape, expected_shape)
 
     def test_add(self):
         inp = layers.Input(shape=[None], ragged=True)
         out = inp + inp
         model = training.Model(inp, out)
 
-        x = tf.ragged.constant([[3, 4], [1, 2], [3, 5]])
+        x = self._x
         self.assertAllEqual(model(x), x + x)
 
     def test_mul(self):
@@ -66,7 +103,7 @@ class RaggedKerasTensorTest(test_combinations.TestCase):
         out = inp * inp
         model = training.Model(inp, out)
 
-        x = tf.ragged.constant([[3, 4], [1, 2], [3, 5]])
+        x = self._x
         self.assertAllEqual(model(x), x * x)
 
     def test_sub(self):
@@ -74,7 +111,7 @@ class RaggedKerasTensorTest(test_combinations.TestCase):
         out = inp - inp
         model = training.Model(inp, out)
 
-        x = tf.ragged.constant([[3, 4], [1, 2], [3, 5]])
+        x = self._x
         self.assertAllEqual(model(x), x - x)
 
     def test_div(self):
@@ -82,7 +119,7 @@ class RaggedKerasTensorTest(test_combinations.TestCase):
         out = inp / inp
         model = training.Model(inp, out)
 
-        x = tf.ragged.constant([[3, 4], [1, 2], [3, 5]])
+        x = self._x
         self.assertAllEqual(model(x), x / x)
 
     def test_getitem(self):
@@ -91,16 +128,13 @@ class RaggedKerasTensorTest(test_combinations.TestCase):
         out = inp[:, :2]
         model = training.Model(inp, out)
 
-        x = tf.RaggedTensor.from_row_lengths(
-            tf.cast(np.random.randn(6, 2), dtype=tf.float32), [3, 1, 2]
-        )
+        x = self._getitem_x
         expected = x[:, :2]
 
         self.assertAllEqual(model(x), expected)
 
         # Test that models w/ slicing are correctly serialized/deserialized
-        config = model.get_config()
-        model = training.Model.from_config(config)
+        model = _from_config_roundtrip(model)
 
         self.assertAllEqual(model(x), expected)
 
@@ -115,13 +149,12 @@ class RaggedKerasTensorTest(test_combinations.TestCase):
         out = getattr(inp, property_name)
         model = training.Model(inp, out)
 
-        x = tf.ragged.constant([[3, 4], [1, 2], [3, 5]])
+        x = self._x
         expected_property = getattr(x, property_name)
         self.assertAllEqual(model(x), expected_property)
 
         # Test that it works with serialization and deserialization as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected_property)
 
     @parameterized.parameters(
@@ -153,28 +186,49 @@ class RaggedKerasTensorTest(test_combinations.TestCase):
         out = getattr(inp, name)(*args, **kwargs)
         model = training.Model(inp, out)
 
-        x = tf.ragged.constant([[3, 4], [1, 2], [3, 5]])
+        x = self._x
         expected_property = getattr(x, name)(*args, **kwargs)
         # We expand composites before checking equality because
         # assertAllEqual otherwise wouldn't work for SparseTensor outputs
+        expected_flat = tf.nest.flatten(
+            expected_property, expand_composites=True
+        )
         for a, b in zip(
-            tf.nest.flatten(model(x), expand_composites=True),
-            tf.nest.flatten(expected_property, expand_composites=True),
+            tf.nest.flatten(model(x), expand_composites=True), expected_flat
         ):
             self.assertAllEqual(a, b)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         for a, b in zip(
-            tf.nest.flatten(model2(x), expand_composites=True),
-            tf.nest.flatten(expected_property, expand_composites=True),
+            tf.nest.flatten(model2(x), expand_composites=True), expected_flat
         ):
             self.assertAllEqual(a, b)
 
 
 @test_utils.run_v2_only
 class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Inputs and row partitions shared by several tests; none of the
+        # tests modify them, so they are only built once.
+        cls._int_values = tf.constant([3, 1, 4, 1, 5, 9, 2, 6])
+        cls._string_values = tf.constant(["a", "b", "c", "d", "e", "f", "g"])
+        cls._row_limits = tf.constant([2, 2, 5, 6, 7], tf.int64)
+        cls._nested_value_rowids = [
+            tf.constant([0, 0, 1, 3, 3], tf.int64),
+            tf.constant([0, 0, 2, 2, 2, 3, 4], tf.int64),
+        ]
+        cls._nested_row_splits = [
+            tf.constant([0, 2, 3, 3, 5], tf.int64),
+            tf.constant([0, 2, 2, 5, 6, 7], tf.int64),
+        ]
+        cls._nested_row_lengths = [
+            tf.constant([2, 1, 0, 2], tf.int64),
+            tf.constant([2, 0, 3, 1, 1], tf.int64),
+        ]
+
     def test_from_value_rowids(self):
         inp = layers.Input(shape=[None])
         out = tf.RaggedTensor.from_value_rowids(
@@ -182,15 +236,14 @@ class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
         )
         model = training.Model(inp, out)
 
-        x = tf.constant([3, 1, 4, 1, 5, 9, 2, 6])
+        x = self._int_values
         expected = tf.RaggedTensor.from_value_rowids(
             x, value_rowids=[0, 0, 0, 0, 2, 2, 2, 3], nrows=5
         )
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_row_splits(self):
@@ -200,15 +253,14 @@ class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
         )
         model = training.Model(inp, out)
 
-        x = tf.constant([3, 1, 4, 1, 5, 9, 2, 6])
+        x = self._int_values
         expected = tf.RaggedTensor.from_row_splits(
             x, row_splits=[0, 4, 4, 7, 8, 8]
         )
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_row_lengths(self):
@@ -216,15 +268,14 @@ class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
         out = tf.RaggedTensor.from_row_lengths(inp, row_lengths=[4, 0, 3, 1, 0])
         model = training.Model(inp, out)
 
-        x = tf.constant([3, 1, 4, 1, 5, 9, 2, 6])
+        x = self._int_values
         expected = tf.RaggedTensor.from_row_lengths(
             x, row_lengths=[4, 0, 3, 1, 0]
         )
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_row_starts(self):
@@ -232,33 +283,31 @@ class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
         out = tf.RaggedTensor.from_row_starts(inp, row_starts=[0, 4, 4, 7, 8])
         model = training.Model(inp, out)
 
-        x = tf.constant([3, 1, 4, 1, 5, 9, 2, 6])
+        x = self._int_values
         expected = tf.RaggedTensor.from_row_starts(
             x, row_starts=[0, 4, 4, 7, 8]
         )
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_row_limits(self):
-        row_limits = tf.constant([2, 2, 5, 6, 7], tf.int64)
+        row_limits = self._row_limits
 
         inp = layers.Input(shape=[None], dtype=tf.string)
         out = tf.RaggedTensor.from_row_limits(inp, row_limits, validate=False)
         model = training.Model(inp, out)
 
-        x = tf.constant(["a", "b", "c", "d", "e", "f", "g"])
+        x = self._string_values
         expected = tf.RaggedTensor.from_row_limits(
             x, row_limits, validate=False
         )
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_uniform_row_length(self):
@@ -271,66 +320,53 @@ class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_nested_value_row_ids(self):
-        nested_value_rowids = [
-            tf.constant([0, 0, 1, 3, 3], tf.int64),
-            tf.constant([0, 0, 2, 2, 2, 3, 4], tf.int64),
-        ]
+        nested_value_rowids = self._nested_value_rowids
         inp = layers.Input(shape=[None], dtype=tf.string)
         out = tf.RaggedTensor.from_nested_value_rowids(inp, nested_value_rowids)
         model = training.Model(inp, out)
 
-        x = tf.constant(["a", "b", "c", "d", "e", "f", "g"])
+        x = self._string_values
         expected = tf.RaggedTensor.from_nested_value_rowids(
             x, nested_value_rowids
         )
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_nested_row_splits(self):
-        nested_row_splits = [
-            tf.constant([0, 2, 3, 3, 5], tf.int64),
-            tf.constant([0, 2, 2, 5, 6, 7], tf.int64),
-        ]
+        nested_row_splits = self._nested_row_splits
         inp = layers.Input(shape=[None], dtype=tf.string)
         out = tf.RaggedTensor.from_nested_row_splits(inp, nested_row_splits)
         model = training.Model(inp, out)
 
-        x = tf.constant(["a", "b", "c", "d", "e", "f", "g"])
+        x = self._string_values
         expected = tf.RaggedTensor.from_nested_row_splits(x, nested_row_splits)
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_nested_row_lengths(self):
-        nested_row_lengths = [
-            tf.constant([2, 1, 0, 2], tf.int64),
-            tf.constant([2, 0, 3, 1, 1], tf.int64),
-        ]
+        nested_row_lengths = self._nested_row_lengths
         inp = layers.Input(shape=[None], dtype=tf.string)
         out = tf.RaggedTensor.from_nested_row_lengths(inp, nested_row_lengths)
         model = training.Model(inp, out)
 
-        x = tf.constant(["a", "b", "c", "d", "e", "f", "g"])
+        x = self._string_values
         expected = tf.RaggedTensor.from_nested_row_lengths(
             x, nested_row_lengths
         )
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_tensor(self):
@@ -343,8 +379,7 @@ class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
         self.assertAllEqual(model(x), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(x), expected)
 
     def test_from_sparse(self):
@@ -361,8 +396,7 @@ class RaggedTensorClassMethodAsLayerTest(test_combinations.TestCase):
         self.assertAllEqual(model(sp_value), expected)
 
         # Test that the model can serialize and deserialize as well
-        model_config = model.get_config()
-        model2 = training.Model.from_config(model_config)
+        model2 = _from_config_roundtrip(model)
         self.assertAllEqual(model2(sp_value), expected)
 
 
@@ -394,8 +394,7 @@ class SliceAggregator(Aggregator):
 
         # This is an approximate threshold, so we don't need to consider the number
         # of bytes per element.
-        num_elements = np.prod(batch_element.shape)
-        if num_elements < self._BINARY_SIZE_THRESHOLD:
+        if batch_element.size < self._BINARY_SIZE_THRESHOLD:
             self.results[batch_start:batch_end] = batch_element
         else:
             is_finished = threading.Event()
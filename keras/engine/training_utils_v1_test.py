@@ -16,9 +16,9 @@
 
 import tensorflow.compat.v2 as tf
 
+import concurrent.futures
 import functools
-import multiprocessing.pool
-import time
+import threading
 
 from absl.testing import parameterized
 import numpy as np
@@ -30,9 +30,22 @@ from keras.engine import training_utils_v1
 from tensorflow.python.platform import tf_logging as logging
 
 
+def _read_only_ones(shape, dtype=np.float64):
+    array = np.ones(shape, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+# `ModelInputs` only inspects its inputs, so the tests can share read-only
+# arrays instead of allocating new ones in every test.
+_ONES_10 = _read_only_ones(10)
+_ONES_20 = _read_only_ones(20)
+_ONES_10_INT32 = _read_only_ones(10, dtype=np.int32)
+
+
 class ModelInputsTest(tf.test.TestCase):
     def test_single_thing(self):
-        a = np.ones(10)
+        a = _ONES_10
         model_inputs = training_utils_v1.ModelInputs(a)
         self.assertEqual(["input_1"], model_inputs.get_input_names())
         vals = model_inputs.get_symbolic_inputs()
@@ -45,7 +58,7 @@ class ModelInputsTest(tf.test.TestCase):
     def test_single_thing_eager(self):
         if not tf.executing_eagerly():
             self.skipTest("Run in eager mode only.")
-        a = np.ones(10, dtype=np.int32)
+        a = _ONES_10_INT32
         model_inputs = training_utils_v1.ModelInputs(a)
         self.assertEqual(["input_1"], model_inputs.get_input_names())
         val = model_inputs.get_symbolic_inputs()
@@ -56,7 +69,7 @@ class ModelInputsTest(tf.test.TestCase):
         self.assertEqual(tf.int32, vals[0].dtype)
 
     def test_list(self):
-        a = [np.ones(10), np.ones(20)]
+        a = [_ONES_10, _ONES_20]
         model_inputs = training_utils_v1.ModelInputs(a)
         self.assertEqual(["input_1", "input_2"], model_inputs.get_input_names())
         vals = model_inputs.get_symbolic_inputs()
@@ -66,7 +79,7 @@ class ModelInputsTest(tf.test.TestCase):
     def test_list_eager(self):
         if not tf.executing_eagerly():
             self.skipTest("Run in eager mode only.")
-        a = [np.ones(10), np.ones(20)]
+        a = [_ONES_10, _ONES_20]
         model_inputs = training_utils_v1.ModelInputs(a)
         self.assertEqual(["input_1", "input_2"], model_inputs.get_input_names())
         vals = model_inputs.get_symbolic_inputs()
@@ -74,7 +87,7 @@ class ModelInputsTest(tf.test.TestCase):
         self.assertIsInstance(vals[1], keras_tensor.KerasTensor)
 
     def test_dict(self):
-        a = {"b": np.ones(10), "a": np.ones(20)}
+        a = {"b": _ONES_10, "a": _ONES_20}
         model_inputs = training_utils_v1.ModelInputs(a)
         self.assertEqual(["a", "b"], model_inputs.get_input_names())
         vals = model_inputs.get_symbolic_inputs()
@@ -84,7 +97,7 @@ class ModelInputsTest(tf.test.TestCase):
     def test_dict_eager(self):
         if not tf.executing_eagerly():
             self.skipTest("Run in eager mode only.")
-        a = {"b": np.ones(10), "a": np.ones(20)}
+        a = {"b": _ONES_10, "a": _ONES_20}
         model_inputs = training_utils_v1.ModelInputs(a)
         self.assertEqual(["a", "b"], model_inputs.get_input_names())
         vals = model_inputs.get_symbolic_inputs()
@@ -92,99 +105,130 @@ class ModelInputsTest(tf.test.TestCase):
         self.assertIsInstance(vals["b"], keras_tensor.KerasTensor)
 
 
-class DatasetUtilsTest(tf.test.TestCase, parameterized.TestCase):
-    @parameterized.named_parameters(
-        # pylint: disable=g-long-lambda
-        ("Batch", lambda: tf.data.Dataset.range(5).batch(2)),
-        ("Cache", lambda: tf.data.Dataset.range(5).cache()),
-        (
-            "Concatenate",
-            lambda: tf.data.Dataset.range(5).concatenate(
-                tf.data.Dataset.range(5)
-            ),
-        ),
-        (
-            "FlatMap",
-            lambda: tf.data.Dataset.range(5).flat_map(
-                lambda _: tf.data.Dataset.from_tensors(0)
-            ),
-        ),
-        (
-            "FlatMap_Shuffle",
-            lambda: tf.data.Dataset.range(5).flat_map(
-                lambda _: tf.data.Dataset.from_tensors(0).shuffle(1)
-            ),
-            True,
-        ),
-        ("Filter", lambda: tf.data.Dataset.range(5).filter(lambda _: True)),
-        (
-            "FixedLengthRecordDatasetV2",
-            lambda: tf.data.FixedLengthRecordDataset([], 42),
-        ),
-        ("FromTensors", lambda: tf.data.Dataset.from_tensors(0)),
-        (
-            "FromTensorSlices",
-            lambda: tf.data.Dataset.from_tensor_slices([0, 0, 0]),
-        ),
-        (
-            "Interleave",
-            lambda: tf.data.Dataset.range(5).interleave(
-                lambda _: tf.data.Dataset.from_tensors(0), cycle_length=1
-            ),
-        ),
-        (
-            "Interleave_Shuffle",
-            lambda: tf.data.Dataset.range(5).interleave(
-                lambda _: tf.data.Dataset.from_tensors(0).shuffle(1),
-                cycle_length=1,
-            ),
-            True,
+# Source datasets shared by the `verify_dataset_shuffled` cases. Dataset
+# transformations never modify their input, so one instance can back them all.
+_RANGE5 = tf.data.Dataset.range(5)
+_RANGE0 = tf.data.Dataset.range(0)
+
+
+def _make_options():
+    options = tf.data.Options()
+    options.experimental_optimization.apply_default_optimizations = True
+    options.deterministic = False
+    return options
+
+
+_OPTIONS = _make_options()
+
+# (name, dataset_fn, expect_shuffled) cases for `verify_dataset_shuffled`.
+_SHUFFLE_CASES = (
+    # pylint: disable=g-long-lambda
+    ("Batch", lambda: _RANGE5.batch(2)),
+    ("Cache", lambda: _RANGE5.cache()),
+    (
+        "Concatenate",
+        lambda: _RANGE5.concatenate(_RANGE5),
+    ),
+    (
+        "FlatMap",
+        lambda: _RANGE5.flat_map(lambda _: tf.data.Dataset.from_tensors(0)),
+    ),
+    (
+        "FlatMap_Shuffle",
+        lambda: _RANGE5.flat_map(
+            lambda _: tf.data.Dataset.from_tensors(0).shuffle(1)
         ),
-        ("Map", lambda: tf.data.Dataset.range(5).map(lambda x: x)),
-        (
-            "Options",
-            lambda: tf.data.Dataset.range(5).with_options(tf.data.Options()),
+        True,
+    ),
+    ("Filter", lambda: _RANGE5.filter(lambda _: True)),
+    (
+        "FixedLengthRecordDatasetV2",
+        lambda: tf.data.FixedLengthRecordDataset([], 42),
+    ),
+    ("FromTensors", lambda: tf.data.Dataset.from_tensors(0)),
+    (
+        "FromTensorSlices",
+        lambda: tf.data.Dataset.from_tensor_slices([0, 0, 0]),
+    ),
+    (
+        "Interleave",
+        lambda: _RANGE5.interleave(
+            lambda _: tf.data.Dataset.from_tensors(0), cycle_length=1
         ),
-        ("PaddedBatch", lambda: tf.data.Dataset.range(5).padded_batch(2, [])),
-        (
-            "ParallelInterleave",
-            lambda: tf.data.Dataset.range(5).interleave(
-                lambda _: tf.data.Dataset.from_tensors(0),
-                cycle_length=1,
-                num_parallel_calls=1,
-            ),
+    ),
+    (
+        "Interleave_Shuffle",
+        lambda: _RANGE5.interleave(
+            lambda _: tf.data.Dataset.from_tensors(0).shuffle(1),
+            cycle_length=1,
         ),
-        (
-            "ParallelMap",
-            lambda: tf.data.Dataset.range(5).map(
-                lambda x: x, num_parallel_calls=1
-            ),
+        True,
+    ),
+    ("Map", lambda: _RANGE5.map(lambda x: x)),
+    (
+        "Options",
+        lambda: _RANGE5.with_options(_OPTIONS),
+    ),
+    ("PaddedBatch", lambda: _RANGE5.padded_batch(2, [])),
+    (
+        "ParallelInterleave",
+        lambda: _RANGE5.interleave(
+            lambda _: tf.data.Dataset.from_tensors(0),
+            cycle_length=1,
+            num_parallel_calls=1,
         ),
-        ("Prefetch", lambda: tf.data.Dataset.range(5).prefetch(1)),
-        ("Range", lambda: tf.data.Dataset.range(0)),
-        ("Repeat", lambda: tf.data.Dataset.range(0).repeat(0)),
-        ("Shuffle", lambda: tf.data.Dataset.range(5).shuffle(1), True),
-        ("Skip", lambda: tf.data.Dataset.range(5).skip(2)),
-        ("Take", lambda: tf.data.Dataset.range(5).take(2)),
-        ("TextLineDataset", lambda: tf.data.TextLineDataset([])),
-        ("TFRecordDataset", lambda: tf.data.TFRecordDataset([])),
-        ("Window", lambda: tf.data.Dataset.range(5).window(2)),
-        ("Zip", lambda: tf.data.Dataset.zip(tf.data.Dataset.range(5))),
-        # pylint: enable=g-long-lambda
-    )
+    ),
+    (
+        "ParallelMap",
+        lambda: _RANGE5.map(lambda x: x, num_parallel_calls=1),
+    ),
+    ("Prefetch", lambda: _RANGE5.prefetch(1)),
+    ("Range", lambda: _RANGE0),
+    ("Repeat", lambda: _RANGE0.repeat(0)),
+    ("Shuffle", lambda: _RANGE5.shuffle(1), True),
+    ("Skip", lambda: _RANGE5.skip(2)),
+    ("Take", lambda: _RANGE5.take(2)),
+    ("TextLineDataset", lambda: tf.data.TextLineDataset([])),
+    ("TFRecordDataset", lambda: tf.data.TFRecordDataset([])),
+    ("Window", lambda: _RANGE5.window(2)),
+    ("Zip", lambda: tf.data.Dataset.zip(_RANGE5)),
+    # pylint: enable=g-long-lambda
+)
+
+
+class _CapturingSink:
+    """Records calls in place of a logging function.
+
+    Cheaper than `mock.patch` for the shuffle checks, which only need the
+    message of the last call.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+    @property
+    def last_fmt(self):
+        return self.calls[-1][0][0] if self.calls else ""
+
+
+class DatasetUtilsTest(tf.test.TestCase, parameterized.TestCase):
+    @parameterized.named_parameters(*_SHUFFLE_CASES)
     def test_verify_dataset_shuffled(self, dataset_fn, expect_shuffled=False):
         dataset = dataset_fn()
 
         if not expect_shuffled:
-            with tf.compat.v1.test.mock.patch.object(
-                logging, "warning"
-            ) as mock_log:
+            sink = _CapturingSink()
+            orig_warning = logging.warning
+            logging.warning = sink
+            try:
                 shuffled = training_utils_v1.verify_dataset_shuffled(dataset)
-                self.assertRegex(
-                    str(mock_log.call_args),
-                    "input dataset `x` is not shuffled.",
-                )
-                self.assertFalse(shuffled)
+            finally:
+                logging.warning = orig_warning
+            self.assertIn("input dataset `x` is not shuffled.", sink.last_fmt)
+            self.assertFalse(shuffled)
         else:
             self.assertTrue(training_utils_v1.verify_dataset_shuffled(dataset))
 
@@ -211,7 +255,9 @@ class StandardizeWeightsTest(test_combinations.TestCase):
         weights = training_utils_v1.standardize_weights(
             y, sample_weights, class_weights
         )
-        expected = sample_weights * np.array([0.5, 1.0, 0.5, 0.5, 1.5])
+        # Dense lookup table of the class weights, indexed by class id.
+        class_weight_table = np.array([0.5, 1.0, 1.5])
+        expected = sample_weights * class_weight_table[y]
         self.assertAllClose(weights, expected)
 
     def test_dataset_with_class_weight(self):
@@ -220,9 +266,11 @@ class StandardizeWeightsTest(test_combinations.TestCase):
 
         inputs = np.zeros((10, 3), np.float32)
         targets = np.zeros((10, 4), np.float32)
+        # The ten samples form exactly one batch, so batch and cache it once
+        # and repeat the cached batch instead of re-slicing every epoch.
         dataset = tf.data.Dataset.from_tensor_slices((inputs, targets))
-        dataset = dataset.repeat(100)
-        dataset = dataset.batch(10)
+        dataset = dataset.batch(10, drop_remainder=True).cache()
+        dataset = dataset.repeat(100).prefetch(tf.data.AUTOTUNE)
         class_weight_np = np.array([0.25, 0.25, 0.25, 0.25])
         class_weight = dict(enumerate(class_weight_np))
 
@@ -235,26 +283,41 @@ class StandardizeWeightsTest(test_combinations.TestCase):
         )
 
 
-class MonitoredPool(multiprocessing.pool.ThreadPool):
-    def __init__(self, *args, **kwargs):
+class MonitoredPool:
+    """Counting stand-in for the copy pool.
+
+    Only `apply_async` is used by `SliceAggregator`, so this wraps a
+    `ThreadPoolExecutor`, which starts its worker threads lazily, rather than
+    a full `multiprocessing.pool.ThreadPool` with its handler threads.
+    """
+
+    def __init__(self, processes):
+        self._executor = concurrent.futures.ThreadPoolExecutor(processes)
         self._apply_counter = 0
         self._func_wrapper = None
-        super().__init__(*args, **kwargs)
 
-    def apply_async(self, func, *args, **kwargs):
+    def apply_async(self, func, args=(), kwds=None):
         self._apply_counter += 1
         if self._func_wrapper:
             func = self._func_wrapper(func)  # pylint: disable=not-callable
-        return super().apply_async(func, *args, **kwargs)
+        return self._executor.submit(func, *args, **(kwds or {}))
 
+    def close(self):
+        self._executor.shutdown(wait=False)
 
-def add_sleep(f):
-    @functools.wraps(f)
-    def wrapped(*args, **kwargs):
-        time.sleep(1.0)
-        return f(*args, **kwargs)
 
-    return wrapped
+def add_block(release):
+    """Returns a pool wrapper whose copies wait until `release` is set."""
+
+    def wrapper(f):
+        @functools.wraps(f)
+        def wrapped(*args, **kwargs):
+            release.wait()
+            return f(*args, **kwargs)
+
+        return wrapped
+
+    return wrapper
 
 
 def cause_error(f):
@@ -276,11 +339,31 @@ _TEST_DATA = np.array(
         (2, 2, 0, 1, 0, 3, 3, 2, 1, 1),
         (3, 0, 3, 3, 3, 2, 1, 0, 0, 1),
         (1, 0, 3, 3, 3, 2, 1, 2, 3, 1),
-    )
+    ),
+    dtype=np.int32,
 )
 
+# `_TEST_DATA` split into four uneven batches, shared by the aggregation
+# tests. The splits are contiguous views along the first axis, and the
+# aggregators only read from them, so they are safe to reuse.
+_TEST_BATCHES = tuple(np.array_split(_TEST_DATA, 4))
+# The same batches paired up as two-output structures for nested aggregation.
+_TEST_NESTED_BATCHES = tuple((batch, batch) for batch in _TEST_BATCHES)
+
 
 class AggregationTest(test_combinations.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One pool serves every test; its counter and wrapper are reset in
+        # setUp.
+        cls._shared_pool = MonitoredPool(training_utils_v1._COPY_THREADS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._shared_pool.close()
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
         self._old_pool = training_utils_v1._COPY_POOL
@@ -288,9 +371,9 @@ class AggregationTest(test_combinations.TestCase):
             training_utils_v1.SliceAggregator._BINARY_SIZE_THRESHOLD
         )
         self._old_timeout = training_utils_v1.SliceAggregator._MAX_COPY_SECONDS
-        training_utils_v1._COPY_POOL = MonitoredPool(
-            training_utils_v1._COPY_THREADS
-        )
+        self._shared_pool._apply_counter = 0
+        self._shared_pool._func_wrapper = None
+        training_utils_v1._COPY_POOL = self._shared_pool
 
     def tearDown(self):
         super().tearDown()
@@ -302,7 +385,7 @@ class AggregationTest(test_combinations.TestCase):
 
     def _run_with_steps(self):
         aggregator = training_utils_v1.OutputsAggregator(use_steps=True)
-        for i, batch in enumerate(np.array_split(_TEST_DATA, 4)):
+        for i, batch in enumerate(_TEST_BATCHES):
             if i == 0:
                 aggregator.create(batch)
             aggregator.aggregate(batch)
@@ -321,7 +404,7 @@ class AggregationTest(test_combinations.TestCase):
         )
 
         batch_start = 0
-        for i, batch in enumerate(np.array_split(_TEST_DATA, 4)):
+        for i, batch in enumerate(_TEST_BATCHES):
             if i == 0:
                 aggregator.create(batch)
 
@@ -348,9 +431,8 @@ class AggregationTest(test_combinations.TestCase):
             use_steps=False, num_samples=6
         )
 
-        batches = np.array_split(_TEST_DATA, 4)
         batch_start = 0
-        for i, batch in enumerate(zip(batches, batches)):
+        for i, batch in enumerate(_TEST_NESTED_BATCHES):
             if i == 0:
                 aggregator.create(batch)
 
@@ -372,6 +454,8 @@ class AggregationTest(test_combinations.TestCase):
         )
 
         aggregator.aggregate(data)
+        # The batch is held by reference before finalize.
+        assert aggregator.results[0].results[0] is data
         aggregator.finalize()
         assert aggregator.results is data  # No copy.
 
@@ -387,6 +471,8 @@ class AggregationTest(test_combinations.TestCase):
         )
 
         aggregator.aggregate(data, 0, 6)
+        # A full batch replaces the preallocated buffer rather than copying.
+        assert aggregator.results[0].results is data
         aggregator.finalize()
         assert aggregator.results is data  # No copy.
 
@@ -400,7 +486,11 @@ class AggregationTest(test_combinations.TestCase):
     def test_async_copy_timeout(self):
         training_utils_v1.SliceAggregator._BINARY_SIZE_THRESHOLD = 15
         training_utils_v1.SliceAggregator._MAX_COPY_SECONDS = 0.1
-        training_utils_v1._COPY_POOL._func_wrapper = add_sleep
+        # Hold the copies until the timeout has been raised, so the outcome
+        # does not depend on how quickly the pool threads get scheduled.
+        release = threading.Event()
+        self.addCleanup(release.set)
+        training_utils_v1._COPY_POOL._func_wrapper = add_block(release)
         with self.assertRaisesRegex(ValueError, "Timed out waiting for copy"):
             self._run_without_steps()
 
@@ -413,32 +503,31 @@ class AggregationTest(test_combinations.TestCase):
 
 
 class CompositeTensorTestUtils(test_combinations.TestCase):
-    def test_is_composite(self):
-        # Validate that all composite tensor and value types return true.
-        self.assertTrue(
-            training_utils_v1.is_composite_or_composite_value(
-                tf.SparseTensor([[0, 0]], [1], [1, 1])
-            )
-        )
-        self.assertTrue(
-            training_utils_v1.is_composite_or_composite_value(
-                tf.compat.v1.SparseTensorValue([[0, 0]], [1], [1, 1])
-            )
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # `is_composite_or_composite_value` only inspects its argument, so the
+        # composite fixtures are built once and shared.
+        cls._sparse = tf.SparseTensor([[0, 0]], [1], [1, 1])
+        cls._sparse_val = tf.compat.v1.SparseTensorValue([[0, 0]], [1], [1, 1])
+        cls._ragged = tf.RaggedTensor.from_row_splits(
+            np.array([0, 1, 2]), np.array([0, 1, 3], dtype=np.int64)
         )
-        self.assertTrue(
-            training_utils_v1.is_composite_or_composite_value(
-                tf.RaggedTensor.from_row_splits(
-                    np.array([0, 1, 2]), np.array([0, 1, 3], dtype=np.int64)
-                )
-            )
+        cls._ragged_val = tf.compat.v1.ragged.RaggedTensorValue(
+            np.array([0, 1, 2]), np.array([0, 1, 3], dtype=np.int64)
         )
-        self.assertTrue(
-            training_utils_v1.is_composite_or_composite_value(
-                tf.compat.v1.ragged.RaggedTensorValue(
-                    np.array([0, 1, 2]), np.array([0, 1, 3], dtype=np.int64)
-                )
+
+    def test_is_composite(self):
+        # Validate that all composite tensor and value types return true.
+        for value in (
+            self._sparse,
+            self._sparse_val,
+            self._ragged,
+            self._ragged_val,
+        ):
+            self.assertTrue(
+                training_utils_v1.is_composite_or_composite_value(value)
             )
-        )
 
         # Test that numpy arrays and tensors return false.
         self.assertFalse(
@@ -475,10 +564,12 @@ class CompositeTensorTestUtils(test_combinations.TestCase):
 
     def test_ragged_concatenation(self):
         tensor_1 = tf.RaggedTensor.from_row_splits(
-            np.array([0, 1, 2]), np.array([0, 1, 3], dtype=np.int64)
+            np.array([0, 1, 2], dtype=np.int64),
+            np.array([0, 1, 3], dtype=np.int64),
         )
         tensor_2 = tf.RaggedTensor.from_row_splits(
-            np.array([3, 4, 5]), np.array([0, 2, 3], dtype=np.int64)
+            np.array([3, 4, 5], dtype=np.int64),
+            np.array([0, 2, 3], dtype=np.int64),
         )
         concatenated_tensor = training_utils_v1._append_composite_tensor(
             tensor_1, tensor_2
@@ -490,10 +581,12 @@ class CompositeTensorTestUtils(test_combinations.TestCase):
 
     def test_ragged_value_concatenation(self):
         tensor_1 = tf.compat.v1.ragged.RaggedTensorValue(
-            np.array([0, 1, 2]), np.array([0, 1, 3], dtype=np.int64)
+            np.array([0, 1, 2], dtype=np.int64),
+            np.array([0, 1, 3], dtype=np.int64),
         )
         tensor_2 = tf.compat.v1.ragged.RaggedTensorValue(
-            np.array([3, 4, 5]), np.array([0, 2, 3], dtype=np.int64)
+            np.array([3, 4, 5], dtype=np.int64),
+            np.array([0, 2, 3], dtype=np.int64),
         )
         concatenated_tensor = training_utils_v1._append_composite_tensor(
             tensor_1, tensor_2
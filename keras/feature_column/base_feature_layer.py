@@ -63,6 +63,9 @@ class _BaseFeaturesLayer(Layer):
             self, self.trainable
         )
         self._partitioner = partitioner
+        # Size of the last output dimension; computed on first use by
+        # `compute_output_shape`.
+        self._total_elements = None
         for column in self._feature_columns:
             if not isinstance(column, expected_column_type):
                 raise ValueError(
@@ -97,10 +100,14 @@ class _BaseFeaturesLayer(Layer):
         raise NotImplementedError("Calling an abstract method.")
 
     def compute_output_shape(self, input_shape):
-        total_elements = 0
-        for column in self._feature_columns:
-            total_elements += column.variable_shape.num_elements()
-        return self._target_shape(input_shape, total_elements)
+        # The feature columns are fixed at construction, so their total size
+        # only needs to be summed once.
+        if self._total_elements is None:
+            self._total_elements = sum(
+                column.variable_shape.num_elements()
+                for column in self._feature_columns
+            )
+        return self._target_shape(input_shape, self._total_elements)
 
     def _process_dense_tensor(self, column, tensor):
         """Reshapes the dense tensor output of a column based on expected shape.
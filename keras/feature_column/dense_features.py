@@ -119,6 +119,14 @@ class DenseFeatures(kfc._BaseFeaturesLayer):  # pylint: disable=protected-access
     def _target_shape(self, input_shape, total_elements):
         return (input_shape[0], total_elements)
 
+    def _process_dense_tensor(self, column, tensor):
+        # Columns that already produce a statically known
+        # (batch_size, num_elements) tensor need no reshape.
+        num_elements = column.variable_shape.num_elements()
+        if tensor.shape.rank == 2 and tensor.shape[1] == num_elements:
+            return tensor
+        return super()._process_dense_tensor(column, tensor)
+
     def call(self, features, cols_to_output_tensors=None, training=None):
         """Returns a dense tensor corresponding to the `feature_columns`.
 
@@ -37,10 +37,96 @@ def _initialized_session(config=None):
     return sess
 
 
+# Sparse id inputs fed to several tests. `SparseTensorValue`s are namedtuples
+# of tuples, so sharing them is safe.
+_IDS_3X3 = tf.compat.v1.SparseTensorValue(
+    indices=((0, 0), (1, 0), (2, 0)),
+    values=(0, 1, 2),
+    dense_shape=(3, 3),
+)
+_AAA_IDS = tf.compat.v1.SparseTensorValue(
+    indices=((0, 0), (1, 0), (1, 1)),
+    values=(0, 1, 0),
+    dense_shape=(2, 2),
+)
+_BBB_IDS = tf.compat.v1.SparseTensorValue(
+    indices=((0, 0), (1, 0), (1, 1)),
+    values=(1, 2, 1),
+    dense_shape=(2, 2),
+)
+_SP_INPUT_4X5 = tf.compat.v1.SparseTensorValue(
+    # example 0, ids [2]
+    # example 1, ids [0, 1]
+    # example 2, ids []
+    # example 3, ids [1]
+    indices=((0, 0), (1, 0), (1, 4), (3, 0)),
+    values=(2, 0, 1, 1),
+    dense_shape=(4, 5),
+)
+_SEQUENCE_SP_INPUT = tf.compat.v1.SparseTensorValue(
+    # example 0, ids [2]
+    # example 1, ids [0, 1]
+    indices=((0, 0), (1, 0), (1, 1)),
+    values=(2, 0, 1),
+    dense_shape=(2, 2),
+)
+
+# Embedding tables returned by the test initializers. They are NumPy arrays
+# rather than `tf.constant`s so that they can initialize variables in any
+# graph.
+# Ids 0, 1 and 2 of a 3-bucket identity column.
+_EMBEDDING_VALUES = np.array(((1, 0), (0, 1), (1, 1)), dtype=np.float32)
+# The two halves of a 4-bucket table split by `fixed_size_partitioner(2)`.
+_EMBEDDING_VALUES_PART_0 = np.array(((1, 0), (0, 1)), dtype=np.float32)
+_EMBEDDING_VALUES_PART_1 = np.array(((1, 1), (2, 2)), dtype=np.float32)
+# Ids 0, 1 and 2 of the "country" vocabulary in the 1-D input tests.
+_COUNTRY_EMBEDDING_VALUES_5D = np.array(
+    (
+        (1.0, 2.0, 3.0, 4.0, 5.0),  # id 0
+        (6.0, 7.0, 8.0, 9.0, 10.0),  # id 1
+        (11.0, 12.0, 13.0, 14.0, 15.0),  # id 2
+    ),
+    dtype=np.float32,
+)
+_COUNTRY_EMBEDDING_VALUES_2D = np.array(
+    (
+        (1.0, 2.0),  # id 0
+        (6.0, 7.0),  # id 1
+        (11.0, 12.0),  # id 2
+    ),
+    dtype=np.float32,
+)
+
+# Expected DenseFeatures outputs, in column order, for the multi-column tests.
+_EXPECTED_PRICE1_PRICE2 = np.array(
+    ((1.0, 2.0, 3.0), (5.0, 6.0, 4.0)), dtype=np.float32
+)
+_EXPECTED_PRICE1_PRICE2_4D = np.array(
+    ((1.0, 2.0, 3.0, 4.0, 5.0, 6.0), (5.0, 6.0, 7.0, 8.0, 9.0, 10.0)),
+    dtype=np.float32,
+)
+
+
+def _make_initializer(values):
+    """Returns an embedding initializer that always produces `values`."""
+
+    def _initializer(shape, dtype, partition_info=None):
+        del shape, dtype, partition_info  # unused
+        return values
+
+    return _initializer
+
+
+def _partitioned_embedding_initializer(shape, dtype, partition_info=None):
+    del shape, dtype  # unused
+    if partition_info._var_offset[0] == 0:
+        return _EMBEDDING_VALUES_PART_0
+    return _EMBEDDING_VALUES_PART_1
+
+
 class DenseFeaturesTest(test_combinations.TestCase):
-    @test_combinations.generate(
-        test_combinations.combine(mode=["graph", "eager"])
-    )
+    # Graph mode is covered by `test_bare_column`.
+    @test_combinations.generate(test_combinations.combine(mode=["eager"]))
     def test_retrieving_input(self):
         features = {"a": [0.0]}
         dense_features = df.DenseFeatures(tf.feature_column.numeric_column("a"))
@@ -49,11 +135,7 @@ class DenseFeaturesTest(test_combinations.TestCase):
 
     @test_combinations.generate(test_combinations.combine(mode=["eager"]))
     def test_reuses_variables(self):
-        sparse_input = tf.SparseTensor(
-            indices=((0, 0), (1, 0), (2, 0)),
-            values=(0, 1, 2),
-            dense_shape=(3, 3),
-        )
+        sparse_input = _IDS_3X3
 
         # Create feature columns (categorical and embedding).
         categorical_column = tf.feature_column.categorical_column_with_identity(
@@ -61,17 +143,10 @@ class DenseFeaturesTest(test_combinations.TestCase):
         )
         embedding_dimension = 2
 
-        def _embedding_column_initializer(shape, dtype, partition_info=None):
-            del shape  # unused
-            del dtype  # unused
-            del partition_info  # unused
-            embedding_values = ((1, 0), (0, 1), (1, 1))  # id 0  # id 1  # id 2
-            return embedding_values
-
         embedding_column = tf.feature_column.embedding_column(
             categorical_column,
             dimension=embedding_dimension,
-            initializer=_embedding_column_initializer,
+            initializer=_make_initializer(_EMBEDDING_VALUES),
         )
 
         dense_features = df.DenseFeatures([embedding_column])
@@ -106,20 +181,10 @@ class DenseFeaturesTest(test_combinations.TestCase):
         )
         embedding_dimension = 2
 
-        def _embedding_column_initializer(shape, dtype, partition_info=None):
-            offset = partition_info._var_offset[0]
-            del shape  # unused
-            del dtype  # unused
-            if offset == 0:
-                embedding_values = ((1, 0), (0, 1))  # id 0  # id 1
-            else:
-                embedding_values = ((1, 1), (2, 2))  # id 2  # id 3
-            return embedding_values
-
         embedding_column = tf.feature_column.embedding_column(
             categorical_column,
             dimension=embedding_dimension,
-            initializer=_embedding_column_initializer,
+            initializer=_partitioned_embedding_initializer,
         )
 
         dense_features = df.DenseFeatures(
@@ -146,11 +211,7 @@ class DenseFeaturesTest(test_combinations.TestCase):
 
     @test_combinations.generate(test_combinations.combine(mode=["eager"]))
     def test_feature_column_dense_features_gradient(self):
-        sparse_input = tf.SparseTensor(
-            indices=((0, 0), (1, 0), (2, 0)),
-            values=(0, 1, 2),
-            dense_shape=(3, 3),
-        )
+        sparse_input = _IDS_3X3
 
         # Create feature columns (categorical and embedding).
         categorical_column = tf.feature_column.categorical_column_with_identity(
@@ -158,17 +219,10 @@ class DenseFeaturesTest(test_combinations.TestCase):
         )
         embedding_dimension = 2
 
-        def _embedding_column_initializer(shape, dtype, partition_info=None):
-            del shape  # unused
-            del dtype  # unused
-            del partition_info  # unused
-            embedding_values = ((1, 0), (0, 1), (1, 1))  # id 0  # id 1  # id 2
-            return embedding_values
-
         embedding_column = tf.feature_column.embedding_column(
             categorical_column,
             dimension=embedding_dimension,
-            initializer=_embedding_column_initializer,
+            initializer=_make_initializer(_EMBEDDING_VALUES),
         )
 
         dense_features = df.DenseFeatures([embedding_column])
@@ -216,27 +270,24 @@ class DenseFeaturesTest(test_combinations.TestCase):
 
     def test_bare_column(self):
         with tf.Graph().as_default():
-            features = features = {"a": [0.0]}
+            features = {"a": np.array([0.0], dtype=np.float32)}
             net = df.DenseFeatures(tf.feature_column.numeric_column("a"))(
                 features
             )
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
             self.assertAllClose([[0.0]], self.evaluate(net))
 
     def test_column_generator(self):
         with tf.Graph().as_default():
-            features = features = {"a": [0.0], "b": [1.0]}
+            features = {
+                "a": np.array([0.0], dtype=np.float32),
+                "b": np.array([1.0], dtype=np.float32),
+            }
             columns = (
                 tf.feature_column.numeric_column(key) for key in features
             )
             net = df.DenseFeatures(columns)(features)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
             self.assertAllClose([[0.0, 1.0]], self.evaluate(net))
 
     def test_raises_if_duplicate_name(self):
@@ -253,32 +304,31 @@ class DenseFeaturesTest(test_combinations.TestCase):
     def test_one_column(self):
         price = tf.feature_column.numeric_column("price")
         with tf.Graph().as_default():
-            features = {"price": [[1.0], [5.0]]}
+            features = {"price": np.array([[1.0], [5.0]], dtype=np.float32)}
             net = df.DenseFeatures([price])(features)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
-            self.assertAllClose([[1.0], [5.0]], self.evaluate(net))
+            self.assertAllEqual([[1.0], [5.0]], self.evaluate(net))
 
     def test_multi_dimension(self):
         price = tf.feature_column.numeric_column("price", shape=2)
         with tf.Graph().as_default():
-            features = {"price": [[1.0, 2.0], [5.0, 6.0]]}
+            features = {
+                "price": np.array([[1.0, 2.0], [5.0, 6.0]], dtype=np.float32),
+            }
             net = df.DenseFeatures([price])(features)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
-            self.assertAllClose([[1.0, 2.0], [5.0, 6.0]], self.evaluate(net))
+            self.assertAllEqual([[1.0, 2.0], [5.0, 6.0]], self.evaluate(net))
 
     def test_compute_output_shape(self):
         price1 = tf.feature_column.numeric_column("price1", shape=2)
         price2 = tf.feature_column.numeric_column("price2", shape=4)
         with tf.Graph().as_default():
             features = {
-                "price1": [[1.0, 2.0], [5.0, 6.0]],
-                "price2": [[3.0, 4.0, 5.0, 6.0], [7.0, 8.0, 9.0, 10.0]],
+                "price1": np.array([[1.0, 2.0], [5.0, 6.0]], dtype=np.float32),
+                "price2": np.array(
+                    [[3.0, 4.0, 5.0, 6.0], [7.0, 8.0, 9.0, 10.0]],
+                    dtype=np.float32,
+                ),
             }
             dense_features = df.DenseFeatures([price1, price2])
             self.assertEqual(
@@ -286,16 +336,7 @@ class DenseFeaturesTest(test_combinations.TestCase):
             )
             net = dense_features(features)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
-            self.assertAllClose(
-                [
-                    [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
-                    [5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
-                ],
-                self.evaluate(net),
-            )
+            self.assertAllEqual(_EXPECTED_PRICE1_PRICE2_4D, self.evaluate(net))
 
     def test_raises_if_shape_mismatch(self):
         price = tf.feature_column.numeric_column("price", shape=2)
@@ -310,30 +351,26 @@ class DenseFeaturesTest(test_combinations.TestCase):
     def test_reshaping(self):
         price = tf.feature_column.numeric_column("price", shape=[1, 2])
         with tf.Graph().as_default():
-            features = {"price": [[[1.0, 2.0]], [[5.0, 6.0]]]}
+            features = {
+                "price": np.array(
+                    [[[1.0, 2.0]], [[5.0, 6.0]]], dtype=np.float32
+                ),
+            }
             net = df.DenseFeatures([price])(features)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
-            self.assertAllClose([[1.0, 2.0], [5.0, 6.0]], self.evaluate(net))
+            self.assertAllEqual([[1.0, 2.0], [5.0, 6.0]], self.evaluate(net))
 
     def test_multi_column(self):
         price1 = tf.feature_column.numeric_column("price1", shape=2)
         price2 = tf.feature_column.numeric_column("price2")
         with tf.Graph().as_default():
             features = {
-                "price1": [[1.0, 2.0], [5.0, 6.0]],
-                "price2": [[3.0], [4.0]],
+                "price1": np.array([[1.0, 2.0], [5.0, 6.0]], dtype=np.float32),
+                "price2": np.array([[3.0], [4.0]], dtype=np.float32),
             }
             net = df.DenseFeatures([price1, price2])(features)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
-            self.assertAllClose(
-                [[1.0, 2.0, 3.0], [5.0, 6.0, 4.0]], self.evaluate(net)
-            )
+            self.assertAllEqual(_EXPECTED_PRICE1_PRICE2, self.evaluate(net))
 
     def test_cols_to_output_tensors(self):
         price1 = tf.feature_column.numeric_column("price1", shape=2)
@@ -341,41 +378,33 @@ class DenseFeaturesTest(test_combinations.TestCase):
         with tf.Graph().as_default():
             cols_dict = {}
             features = {
-                "price1": [[1.0, 2.0], [5.0, 6.0]],
-                "price2": [[3.0], [4.0]],
+                "price1": np.array([[1.0, 2.0], [5.0, 6.0]], dtype=np.float32),
+                "price2": np.array([[3.0], [4.0]], dtype=np.float32),
             }
             dense_features = df.DenseFeatures([price1, price2])
             net = dense_features(features, cols_dict)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
-            self.assertAllClose(
+            self.assertAllEqual(
                 [[1.0, 2.0], [5.0, 6.0]], self.evaluate(cols_dict[price1])
             )
-            self.assertAllClose(
+            self.assertAllEqual(
                 [[3.0], [4.0]], self.evaluate(cols_dict[price2])
             )
-            self.assertAllClose(
-                [[1.0, 2.0, 3.0], [5.0, 6.0, 4.0]], self.evaluate(net)
-            )
+            self.assertAllEqual(_EXPECTED_PRICE1_PRICE2, self.evaluate(net))
 
     def test_column_order(self):
         price_a = tf.feature_column.numeric_column("price_a")
         price_b = tf.feature_column.numeric_column("price_b")
         with tf.Graph().as_default():
             features = {
-                "price_a": [[1.0]],
-                "price_b": [[3.0]],
+                "price_a": np.array([[1.0]], dtype=np.float32),
+                "price_b": np.array([[3.0]], dtype=np.float32),
             }
             net1 = df.DenseFeatures([price_a, price_b])(features)
             net2 = df.DenseFeatures([price_b, price_a])(features)
 
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
-
-            self.assertAllClose([[1.0, 3.0]], self.evaluate(net1))
-            self.assertAllClose([[1.0, 3.0]], self.evaluate(net2))
+            self.assertAllEqual([[1.0, 3.0]], self.evaluate(net1))
+            self.assertAllEqual([[1.0, 3.0]], self.evaluate(net2))
 
     def test_fails_for_categorical_column(self):
         animal = tf.feature_column.categorical_column_with_identity(
@@ -425,46 +454,49 @@ class DenseFeaturesTest(test_combinations.TestCase):
     def test_runtime_batch_size_mismatch(self):
         price1 = tf.feature_column.numeric_column("price1")
         price2 = tf.feature_column.numeric_column("price2")
-        with tf.Graph().as_default():
-            features = {
-                "price1": tf.compat.v1.placeholder(
-                    dtype=tf.int64
-                ),  # batchsize = 3
-                "price2": [[3.0], [4.0]],  # batchsize = 2
-            }
-            net = df.DenseFeatures([price1, price2])(features)
-            with _initialized_session() as sess:
-                with self.assertRaisesRegex(
-                    tf.errors.OpError,
-                    "Dimension 0 in both shapes must be equal|"
-                    "Dimensions of inputs should match",
-                ):
-                    sess.run(
-                        net,
-                        feed_dict={features["price1"]: [[1.0], [5.0], [7.0]]},
-                    )
+        dense_features = df.DenseFeatures([price1, price2])
+
+        # An unknown-shape input signature defers the batch size check to
+        # runtime, like a placeholder would.
+        @tf.function(input_signature=[tf.TensorSpec(None, tf.int64)])
+        def net(price1_value):
+            return dense_features(
+                {
+                    "price1": price1_value,  # batchsize = 3
+                    "price2": [[3.0], [4.0]],  # batchsize = 2
+                }
+            )
+
+        with self.assertRaisesRegex(
+            tf.errors.OpError,
+            "Dimension 0 in both shapes must be equal|"
+            "Dimensions of inputs should match",
+        ):
+            net(tf.constant([[1], [5], [7]], dtype=tf.int64))
 
     def test_runtime_batch_size_matches(self):
         price1 = tf.feature_column.numeric_column("price1")
         price2 = tf.feature_column.numeric_column("price2")
-        with tf.Graph().as_default():
-            features = {
-                "price1": tf.compat.v1.placeholder(
-                    dtype=tf.int64
-                ),  # batchsize = 2
-                "price2": tf.compat.v1.placeholder(
-                    dtype=tf.int64
-                ),  # batchsize = 2
-            }
-            net = df.DenseFeatures([price1, price2])(features)
-            with _initialized_session() as sess:
-                sess.run(
-                    net,
-                    feed_dict={
-                        features["price1"]: [[1.0], [5.0]],
-                        features["price2"]: [[1.0], [5.0]],
-                    },
-                )
+        dense_features = df.DenseFeatures([price1, price2])
+
+        @tf.function(
+            input_signature=[
+                tf.TensorSpec(None, tf.int64),
+                tf.TensorSpec(None, tf.int64),
+            ]
+        )
+        def net(price1_value, price2_value):
+            return dense_features(
+                {
+                    "price1": price1_value,  # batchsize = 2
+                    "price2": price2_value,  # batchsize = 2
+                }
+            )
+
+        net(
+            tf.constant([[1], [5]], dtype=tf.int64),
+            tf.constant([[1], [5]], dtype=tf.int64),
+        )
 
     def test_multiple_layers_with_same_embedding_column(self):
         some_sparse_column = (
@@ -482,28 +514,21 @@ class DenseFeaturesTest(test_combinations.TestCase):
             }
             all_cols = [some_embedding_column]
             df.DenseFeatures(all_cols)(features)
-            df.DenseFeatures(all_cols)(features)
+            # Variables are created in `build`, so the second layer does not
+            # need to run the lookup.
+            df.DenseFeatures(all_cols).build(None)
             # Make sure that 2 variables get created in this case.
-            self.assertEqual(
-                2,
-                len(
-                    tf.compat.v1.get_collection(
-                        tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
-                    )
-                ),
+            global_vars = tf.compat.v1.get_collection(
+                tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
             )
+            self.assertEqual(2, len(global_vars))
             expected_var_names = [
                 "dense_features/sparse_feature_embedding/embedding_weights:0",
                 "dense_features_1/sparse_feature_embedding/embedding_weights:0",
             ]
             self.assertCountEqual(
                 expected_var_names,
-                [
-                    v.name
-                    for v in tf.compat.v1.get_collection(
-                        tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
-                    )
-                ],
+                [v.name for v in global_vars],
             )
 
     @tf_test_utils.run_deprecated_v1
@@ -529,37 +554,20 @@ class DenseFeaturesTest(test_combinations.TestCase):
 
         with tf.Graph().as_default():
             features = {
-                "aaa": tf.SparseTensor(
-                    indices=((0, 0), (1, 0), (1, 1)),
-                    values=(0, 1, 0),
-                    dense_shape=(2, 2),
-                ),
-                "bbb": tf.SparseTensor(
-                    indices=((0, 0), (1, 0), (1, 1)),
-                    values=(1, 2, 1),
-                    dense_shape=(2, 2),
-                ),
+                "aaa": _AAA_IDS,
+                "bbb": _BBB_IDS,
             }
             all_cols = [embedding_column_a, embedding_column_b]
             df.DenseFeatures(all_cols)(features)
             df.DenseFeatures(all_cols)(features)
             # Make sure that only 1 variable gets created in this case.
-            self.assertEqual(
-                1,
-                len(
-                    tf.compat.v1.get_collection(
-                        tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
-                    )
-                ),
+            global_vars = tf.compat.v1.get_collection(
+                tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
             )
+            self.assertEqual(1, len(global_vars))
             self.assertCountEqual(
                 ["aaa_bbb_shared_embedding:0"],
-                [
-                    v.name
-                    for v in tf.compat.v1.get_collection(
-                        tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
-                    )
-                ],
+                [v.name for v in global_vars],
             )
 
     @tf_test_utils.run_deprecated_v1
@@ -588,74 +596,35 @@ class DenseFeaturesTest(test_combinations.TestCase):
 
         with tf.Graph().as_default():
             features = {
-                "aaa": tf.SparseTensor(
-                    indices=((0, 0), (1, 0), (1, 1)),
-                    values=(0, 1, 0),
-                    dense_shape=(2, 2),
-                ),
-                "bbb": tf.SparseTensor(
-                    indices=((0, 0), (1, 0), (1, 1)),
-                    values=(1, 2, 1),
-                    dense_shape=(2, 2),
-                ),
+                "aaa": _AAA_IDS,
+                "bbb": _BBB_IDS,
             }
             df.DenseFeatures(all_cols)(features)
             # Make sure that only 1 variable gets created in this case.
-            self.assertEqual(
-                1,
-                len(
-                    tf.compat.v1.get_collection(
-                        tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
-                    )
-                ),
+            global_vars = tf.compat.v1.get_collection(
+                tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
             )
+            self.assertEqual(1, len(global_vars))
 
         with tf.Graph().as_default():
             features1 = {
-                "aaa": tf.SparseTensor(
-                    indices=((0, 0), (1, 0), (1, 1)),
-                    values=(0, 1, 0),
-                    dense_shape=(2, 2),
-                ),
-                "bbb": tf.SparseTensor(
-                    indices=((0, 0), (1, 0), (1, 1)),
-                    values=(1, 2, 1),
-                    dense_shape=(2, 2),
-                ),
+                "aaa": _AAA_IDS,
+                "bbb": _BBB_IDS,
             }
 
             df.DenseFeatures(all_cols)(features1)
             # Make sure that only 1 variable gets created in this case.
-            self.assertEqual(
-                1,
-                len(
-                    tf.compat.v1.get_collection(
-                        tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
-                    )
-                ),
+            global_vars = tf.compat.v1.get_collection(
+                tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
             )
+            self.assertEqual(1, len(global_vars))
             self.assertCountEqual(
                 ["aaa_bbb_shared_embedding:0"],
-                [
-                    v.name
-                    for v in tf.compat.v1.get_collection(
-                        tf.compat.v1.GraphKeys.GLOBAL_VARIABLES
-                    )
-                ],
+                [v.name for v in global_vars],
             )
 
     @tf_test_utils.run_deprecated_v1
     def test_with_1d_sparse_tensor(self):
-        embedding_values = (
-            (1.0, 2.0, 3.0, 4.0, 5.0),  # id 0
-            (6.0, 7.0, 8.0, 9.0, 10.0),  # id 1
-            (11.0, 12.0, 13.0, 14.0, 15.0),  # id 2
-        )
-
-        def _initializer(shape, dtype, partition_info=None):
-            del shape, dtype, partition_info
-            return embedding_values
-
         # price has 1 dimension in dense_features
         price = tf.feature_column.numeric_column("price")
 
@@ -670,7 +639,9 @@ class DenseFeaturesTest(test_combinations.TestCase):
             "country", vocabulary_list=["US", "JP", "CA"]
         )
         embedded_country = tf.feature_column.embedding_column(
-            country, dimension=5, initializer=_initializer
+            country,
+            dimension=5,
+            initializer=_make_initializer(_COUNTRY_EMBEDDING_VALUES_5D),
         )
 
         # Provides 1-dim tensor and dense tensor.
@@ -711,16 +682,6 @@ class DenseFeaturesTest(test_combinations.TestCase):
 
     @tf_test_utils.run_deprecated_v1
     def test_with_1d_unknown_shape_sparse_tensor(self):
-        embedding_values = (
-            (1.0, 2.0),  # id 0
-            (6.0, 7.0),  # id 1
-            (11.0, 12.0),  # id 2
-        )
-
-        def _initializer(shape, dtype, partition_info=None):
-            del shape, dtype, partition_info
-            return embedding_values
-
         # price has 1 dimension in dense_features
         price = tf.feature_column.numeric_column("price")
 
@@ -735,7 +696,9 @@ class DenseFeaturesTest(test_combinations.TestCase):
             "country", vocabulary_list=["US", "JP", "CA"]
         )
         embedded_country = tf.feature_column.embedding_column(
-            country, dimension=2, initializer=_initializer
+            country,
+            dimension=2,
+            initializer=_make_initializer(_COUNTRY_EMBEDDING_VALUES_2D),
         )
 
         # Provides 1-dim tensor and dense tensor.
@@ -805,25 +768,22 @@ class DenseFeaturesTest(test_combinations.TestCase):
 
 
 class IndicatorColumnTest(tf.test.TestCase):
-    @tf_test_utils.run_deprecated_v1
     def test_dense_features(self):
+        # The identity indicator column has no variables or tables, so it runs
+        # eagerly without any initialization.
         animal = tf.feature_column.indicator_column(
             tf.feature_column.categorical_column_with_identity(
                 "animal", num_buckets=4
             )
         )
-        with tf.Graph().as_default():
-            features = {
-                "animal": tf.SparseTensor(
-                    indices=[[0, 0], [0, 1]], values=[1, 2], dense_shape=[1, 2]
-                )
-            }
-            net = df.DenseFeatures([animal])(features)
-
-            self.evaluate(tf.compat.v1.global_variables_initializer())
-            self.evaluate(tf.compat.v1.tables_initializer())
+        features = {
+            "animal": tf.SparseTensor(
+                indices=[[0, 0], [0, 1]], values=[1, 2], dense_shape=[1, 2]
+            )
+        }
+        net = df.DenseFeatures([animal])(features)
 
-            self.assertAllClose([[0.0, 1.0, 1.0, 0.0]], self.evaluate(net))
+        self.assertAllClose([[0.0, 1.0, 1.0, 0.0]], self.evaluate(net))
 
 
 class EmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
@@ -855,23 +815,18 @@ class EmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
     ):
         # Inputs.
         vocabulary_size = 4
-        sparse_input = tf.compat.v1.SparseTensorValue(
-            # example 0, ids [2]
-            # example 1, ids [0, 1]
-            # example 2, ids []
-            # example 3, ids [1]
-            indices=((0, 0), (1, 0), (1, 4), (3, 0)),
-            values=(2, 0, 1, 1),
-            dense_shape=(4, 5),
-        )
+        sparse_input = _SP_INPUT_4X5
 
         # Embedding variable.
         embedding_dimension = 2
-        embedding_values = (
-            (1.0, 2.0),  # id 0
-            (3.0, 5.0),  # id 1
-            (7.0, 11.0),  # id 2
-            (9.0, 13.0),  # id 3
+        embedding_values = np.array(
+            (
+                (1.0, 2.0),  # id 0
+                (3.0, 5.0),  # id 1
+                (7.0, 11.0),  # id 2
+                (9.0, 13.0),  # id 3
+            ),
+            dtype=np.float32,
         )
 
         def _initializer(shape, dtype, partition_info=None):
@@ -931,12 +886,12 @@ class EmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
                     "vars/dense_features/aaa_embedding/embedding_weights/part_0:0",
                     "vars/dense_features/aaa_embedding/embedding_weights/part_1:0",
                 ),
-                tuple([v.name for v in global_vars]),
+                [v.name for v in global_vars],
             )
         else:
             self.assertCountEqual(
                 ("vars/dense_features/aaa_embedding/embedding_weights:0",),
-                tuple([v.name for v in global_vars]),
+                [v.name for v in global_vars],
             )
         for v in global_vars:
             self.assertIsInstance(v, tf.Variable)
@@ -949,57 +904,50 @@ class EmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
                     "vars/dense_features/aaa_embedding/embedding_weights/part_0:0",
                     "vars/dense_features/aaa_embedding/embedding_weights/part_1:0",
                 ),
-                tuple([v.name for v in trainable_vars]),
+                [v.name for v in trainable_vars],
             )
         else:
             self.assertCountEqual(
                 ("vars/dense_features/aaa_embedding/embedding_weights:0",),
-                tuple([v.name for v in trainable_vars]),
+                [v.name for v in trainable_vars],
             )
 
-        self.evaluate(tf.compat.v1.global_variables_initializer())
-        self.evaluate(tf.compat.v1.tables_initializer())
+        self.evaluate(
+            [
+                tf.compat.v1.global_variables_initializer(),
+                tf.compat.v1.tables_initializer(),
+            ]
+        )
 
-        self.assertAllEqual(embedding_values, self.evaluate(trainable_vars[0]))
-        self.assertAllEqual(expected_lookups, self.evaluate(dense_features))
+        embedding_r, lookups_r = self.evaluate(
+            [trainable_vars[0], dense_features]
+        )
+        self.assertAllEqual(embedding_values, embedding_r)
+        self.assertAllEqual(expected_lookups, lookups_r)
 
+        op_types = {
+            x.type for x in tf.compat.v1.get_default_graph().get_operations()
+        }
         if use_safe_embedding_lookup:
-            self.assertIn(
-                "SparseFillEmptyRows",
-                [
-                    x.type
-                    for x in tf.compat.v1.get_default_graph().get_operations()
-                ],
-            )
+            self.assertIn("SparseFillEmptyRows", op_types)
         else:
-            self.assertNotIn(
-                "SparseFillEmptyRows",
-                [
-                    x.type
-                    for x in tf.compat.v1.get_default_graph().get_operations()
-                ],
-            )
+            self.assertNotIn("SparseFillEmptyRows", op_types)
 
     @tf_test_utils.run_deprecated_v1
     def test_dense_features_not_trainable(self):
         # Inputs.
         vocabulary_size = 3
-        sparse_input = tf.compat.v1.SparseTensorValue(
-            # example 0, ids [2]
-            # example 1, ids [0, 1]
-            # example 2, ids []
-            # example 3, ids [1]
-            indices=((0, 0), (1, 0), (1, 4), (3, 0)),
-            values=(2, 0, 1, 1),
-            dense_shape=(4, 5),
-        )
+        sparse_input = _SP_INPUT_4X5
 
         # Embedding variable.
         embedding_dimension = 2
-        embedding_values = (
-            (1.0, 2.0),  # id 0
-            (3.0, 5.0),  # id 1
-            (7.0, 11.0),  # id 2
+        embedding_values = np.array(
+            (
+                (1.0, 2.0),  # id 0
+                (3.0, 5.0),  # id 1
+                (7.0, 11.0),  # id 2
+            ),
+            dtype=np.float32,
         )
 
         def _initializer(shape, dtype, partition_info=None):
@@ -1042,7 +990,7 @@ class EmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
         )
         self.assertCountEqual(
             ("dense_features/aaa_embedding/embedding_weights:0",),
-            tuple([v.name for v in global_vars]),
+            [v.name for v in global_vars],
         )
         self.assertCountEqual(
             [],
@@ -1051,11 +999,16 @@ class EmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
             ),
         )
 
-        self.evaluate(tf.compat.v1.global_variables_initializer())
-        self.evaluate(tf.compat.v1.tables_initializer())
+        self.evaluate(
+            [
+                tf.compat.v1.global_variables_initializer(),
+                tf.compat.v1.tables_initializer(),
+            ]
+        )
 
-        self.assertAllEqual(embedding_values, self.evaluate(global_vars[0]))
-        self.assertAllEqual(expected_lookups, self.evaluate(dense_features))
+        embedding_r, lookups_r = self.evaluate([global_vars[0], dense_features])
+        self.assertAllEqual(embedding_values, embedding_r)
+        self.assertAllEqual(expected_lookups, lookups_r)
 
 
 class SharedEmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
@@ -1093,10 +1046,13 @@ class SharedEmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
 
         # Embedding variable.
         embedding_dimension = 2
-        embedding_values = (
-            (1.0, 2.0),  # id 0
-            (3.0, 5.0),  # id 1
-            (7.0, 11.0),  # id 2
+        embedding_values = np.array(
+            (
+                (1.0, 2.0),  # id 0
+                (3.0, 5.0),  # id 1
+                (7.0, 11.0),  # id 2
+            ),
+            dtype=np.float32,
         )
 
         def _initializer(shape, dtype, partition_info=None):
@@ -1185,7 +1141,7 @@ class SharedEmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
         )
         self.assertCountEqual(
             ["aaa_bbb_shared_embedding:0", "ccc_ddd_shared_embedding:0"],
-            tuple([v.name for v in global_vars]),
+            [v.name for v in global_vars],
         )
         for v in global_vars:
             self.assertIsInstance(v, tf.Variable)
@@ -1195,19 +1151,24 @@ class SharedEmbeddingColumnTest(tf.test.TestCase, parameterized.TestCase):
         if trainable:
             self.assertCountEqual(
                 ["aaa_bbb_shared_embedding:0", "ccc_ddd_shared_embedding:0"],
-                tuple([v.name for v in trainable_vars]),
+                [v.name for v in trainable_vars],
             )
         else:
-            self.assertCountEqual([], tuple([v.name for v in trainable_vars]))
+            self.assertCountEqual([], [v.name for v in trainable_vars])
         shared_embedding_vars = global_vars
 
-        self.evaluate(tf.compat.v1.global_variables_initializer())
-        self.evaluate(tf.compat.v1.tables_initializer())
+        self.evaluate(
+            [
+                tf.compat.v1.global_variables_initializer(),
+                tf.compat.v1.tables_initializer(),
+            ]
+        )
 
-        self.assertAllEqual(
-            embedding_values, self.evaluate(shared_embedding_vars[0])
+        embedding_r, lookups_r = self.evaluate(
+            [shared_embedding_vars[0], dense_features]
         )
-        self.assertAllEqual(expected_lookups, self.evaluate(dense_features))
+        self.assertAllEqual(embedding_values, embedding_r)
+        self.assertAllEqual(expected_lookups, lookups_r)
 
     @tf_test_utils.run_deprecated_v1
     def test_dense_features(self):
@@ -1308,13 +1269,7 @@ class SequenceFeatureColumnsTest(tf.test.TestCase):
     def test_embedding_column(self):
         """Tests that error is raised for sequence embedding column."""
         vocabulary_size = 3
-        sparse_input = tf.compat.v1.SparseTensorValue(
-            # example 0, ids [2]
-            # example 1, ids [0, 1]
-            indices=((0, 0), (1, 0), (1, 1)),
-            values=(2, 0, 1),
-            dense_shape=(2, 2),
-        )
+        sparse_input = _SEQUENCE_SP_INPUT
 
         categorical_column_a = (
             tf.feature_column.sequence_categorical_column_with_identity(
@@ -1336,13 +1291,7 @@ class SequenceFeatureColumnsTest(tf.test.TestCase):
     def test_indicator_column(self):
         """Tests that error is raised for sequence indicator column."""
         vocabulary_size = 3
-        sparse_input = tf.compat.v1.SparseTensorValue(
-            # example 0, ids [2]
-            # example 1, ids [0, 1]
-            indices=((0, 0), (1, 0), (1, 1)),
-            values=(2, 0, 1),
-            dense_shape=(2, 2),
-        )
+        sparse_input = _SEQUENCE_SP_INPUT
 
         categorical_column_a = (
             tf.feature_column.sequence_categorical_column_with_identity(
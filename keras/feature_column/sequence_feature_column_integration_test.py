@@ -28,7 +28,6 @@ from tensorflow.core.example import feature_pb2
 from tensorflow.python.framework import (
     test_util as tf_test_utils,
 )
-from keras import backend
 from keras.feature_column import dense_features
 from keras.feature_column import sequence_feature_column as ksfc
 from keras.layers import merging
@@ -83,47 +82,57 @@ class SequenceFeatureColumnIntegrationTest(tf.test.TestCase):
         return ctx_cols, seq_cols
 
     def test_sequence_example_into_input_layer(self):
-        examples = [_make_sequence_example().SerializeToString()] * 100
+        examples = [_SEQUENCE_EXAMPLE_BYTES] * 100
         ctx_cols, seq_cols = self._build_feature_columns()
+        ctx_spec = tf.feature_column.make_parse_example_spec(ctx_cols)
+        seq_spec = tf.feature_column.make_parse_example_spec(seq_cols)
 
-        def _parse_example(example):
-            ctx, seq = tf.io.parse_single_sequence_example(
-                example,
-                context_features=tf.feature_column.make_parse_example_spec(
-                    ctx_cols
-                ),
-                sequence_features=tf.feature_column.make_parse_example_spec(
-                    seq_cols
-                ),
+        def _parse_examples(serialized):
+            ctx, seq, _ = tf.io.parse_sequence_example(
+                serialized,
+                context_features=ctx_spec,
+                sequence_features=seq_spec,
             )
             ctx.update(seq)
             return ctx
 
+        # Batch the serialized protos first so that each batch is parsed by a
+        # single op.
         ds = tf.data.Dataset.from_tensor_slices(examples)
-        ds = ds.map(_parse_example)
         ds = ds.batch(20)
+        # Every batch holds the same examples, so batch order does not matter.
+        ds = ds.map(
+            _parse_examples,
+            num_parallel_calls=tf.data.AUTOTUNE,
+            deterministic=False,
+        )
+        ds = ds.prefetch(tf.data.AUTOTUNE)
 
         # Test on a single batch
-        features = tf.compat.v1.data.make_one_shot_iterator(ds).get_next()
+        features = next(iter(ds))
+        self.assertAllEqual(features["int_list"].dense_shape, [20, 3, 6])
 
-        # Tile the context features across the sequence features
         sequence_input_layer = ksfc.SequenceFeatures(seq_cols)
-        seq_input, _ = sequence_input_layer(features)
         dense_input_layer = dense_features.DenseFeatures(ctx_cols)
-        ctx_input = dense_input_layer(features)
-        ctx_input = backend.repeat(ctx_input, tf.shape(seq_input)[1])
-        concatenated_input = merging.concatenate([seq_input, ctx_input])
-
         rnn_layer = base_rnn.RNN(simple_rnn.SimpleRNNCell(10))
-        output = rnn_layer(concatenated_input)
 
-        with self.cached_session() as sess:
-            sess.run(tf.compat.v1.global_variables_initializer())
-            features_r = sess.run(features)
-            self.assertAllEqual(features_r["int_list"].dense_shape, [20, 3, 6])
+        # The sparse lookups and string hashing are not XLA-compilable, so the
+        # step is traced without `jit_compile`.
+        @tf.function
+        def step(features):
+            seq_input, _ = sequence_input_layer(features)
+            ctx_input = dense_input_layer(features)
+            # Tile the context features across the sequence features
+            seq_shape = tf.shape(seq_input)
+            ctx_input = tf.broadcast_to(
+                ctx_input[:, tf.newaxis, :],
+                [seq_shape[0], seq_shape[1], ctx_input.shape[-1]],
+            )
+            concatenated_input = merging.concatenate([seq_input, ctx_input])
+            return rnn_layer(concatenated_input)
 
-            output_r = sess.run(output)
-            self.assertAllEqual(output_r.shape, [20, 10])
+        output = step(features)
+        self.assertAllEqual(output.shape, [20, 10])
 
     @tf_test_utils.run_deprecated_v1
     def test_shared_sequence_non_sequence_into_input_layer(self):
@@ -141,17 +150,13 @@ class SequenceFeatureColumnIntegrationTest(tf.test.TestCase):
             shared_embedding_collection_name="shared",
         )
 
-        seq = tf.SparseTensor(
+        # Both features carry the same ids.
+        ids = tf.SparseTensor(
             indices=[[0, 0], [0, 1], [1, 0]],
             values=[0, 1, 2],
             dense_shape=[2, 2],
         )
-        non_seq = tf.SparseTensor(
-            indices=[[0, 0], [0, 1], [1, 0]],
-            values=[0, 1, 2],
-            dense_shape=[2, 2],
-        )
-        features = {"seq": seq, "non_seq": non_seq}
+        features = {"seq": ids, "non_seq": ids}
 
         # Tile the context features across the sequence features
         seq_input, seq_length = ksfc.SequenceFeatures([shared_seq])(features)
@@ -278,5 +283,9 @@ def _make_sequence_example():
     return text_format.Parse(_SEQ_EX_PROTO, example)
 
 
+# Serialized once at import. Bytes are immutable, unlike the parsed proto.
+_SEQUENCE_EXAMPLE_BYTES = _make_sequence_example().SerializeToString()
+
+
 if __name__ == "__main__":
     tf.test.main()
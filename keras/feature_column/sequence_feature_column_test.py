@@ -37,25 +37,148 @@ def _initialized_session(config=None):
     return sess
 
 
+# Sparse inputs for the parameterized SequenceFeaturesTest cases, shared
+# between cases and tests. `SparseTensorValue`s are namedtuples of tuples, so
+# sharing them is safe.
+_IDS_A_2D = tf.compat.v1.SparseTensorValue(
+    # example 0, ids [2]
+    # example 1, ids [0, 1]
+    indices=((0, 0), (1, 0), (1, 1)),
+    values=(2, 0, 1),
+    dense_shape=(2, 2),
+)
+_IDS_A_3D = tf.compat.v1.SparseTensorValue(
+    # feature 0, ids [[2], [0, 1]]
+    # feature 1, ids [[0, 0], [1]]
+    indices=(
+        (0, 0, 0),
+        (0, 1, 0),
+        (0, 1, 1),
+        (1, 0, 0),
+        (1, 0, 1),
+        (1, 1, 0),
+    ),
+    values=(2, 0, 1, 0, 0, 1),
+    dense_shape=(2, 2, 2),
+)
+_EMBEDDING_IDS_B_2D = tf.compat.v1.SparseTensorValue(
+    # example 0, ids [1]
+    # example 1, ids [2, 0]
+    indices=((0, 0), (1, 0), (1, 1)),
+    values=(1, 2, 0),
+    dense_shape=(2, 2),
+)
+_EMBEDDING_IDS_B_3D = tf.compat.v1.SparseTensorValue(
+    # feature 0, ids [[1, 1], [1]]
+    # feature 1, ids [[2], [0]]
+    indices=((0, 0, 0), (0, 0, 1), (0, 1, 0), (1, 0, 0), (1, 1, 0)),
+    values=(1, 1, 1, 2, 0),
+    dense_shape=(2, 2, 2),
+)
+_INDICATOR_IDS_B_2D = tf.compat.v1.SparseTensorValue(
+    # example 0, ids [1]
+    # example 1, ids [1, 0]
+    indices=((0, 0), (1, 0), (1, 1)),
+    values=(1, 1, 0),
+    dense_shape=(2, 2),
+)
+_INDICATOR_IDS_B_3D = tf.compat.v1.SparseTensorValue(
+    # feature 0, ids [[1, 1], [1]]
+    # feature 1, ids [[1], [0]]
+    indices=((0, 0, 0), (0, 0, 1), (0, 1, 0), (1, 0, 0), (1, 1, 0)),
+    values=(1, 1, 1, 1, 0),
+    dense_shape=(2, 2, 2),
+)
+_NUMERIC_VALUES_2D = tf.compat.v1.SparseTensorValue(
+    # example 0, values [0., 1]
+    # example 1, [10.]
+    indices=((0, 0), (0, 1), (1, 0)),
+    values=(0.0, 1.0, 10.0),
+    dense_shape=(2, 2),
+)
+_NUMERIC_VALUES_3D = tf.compat.v1.SparseTensorValue(
+    # feature 0, ids [[20, 3], [5]]
+    # feature 1, ids [[3], [8]]
+    indices=((0, 0, 0), (0, 0, 1), (0, 1, 0), (1, 0, 0), (1, 1, 0)),
+    values=(20.0, 3.0, 5.0, 3.0, 8.0),
+    dense_shape=(2, 2, 2),
+)
+# Inputs for a sequence_numeric_column of shape (2, 2).
+_NUMERIC_2X2_VALUES_2D = tf.compat.v1.SparseTensorValue(
+    # example 0, values [[[0., 1.],  [2., 3.]], [[4., 5.],  [6., 7.]]]
+    # example 1, [[[10., 11.],  [12., 13.]]]
+    indices=(
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (0, 4),
+        (0, 5),
+        (0, 6),
+        (0, 7),
+        (1, 0),
+        (1, 1),
+        (1, 2),
+        (1, 3),
+    ),
+    values=(0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 10.0, 11.0, 12.0, 13.0),
+    dense_shape=(2, 8),
+)
+_NUMERIC_2X2_VALUES_3D = tf.compat.v1.SparseTensorValue(
+    # example 0, values [[0., 1., 2., 3.]], [[4., 5., 6., 7.]]
+    # example 1, [[10., 11., 12., 13.], []]
+    indices=(
+        (0, 0, 0),
+        (0, 0, 1),
+        (0, 0, 2),
+        (0, 0, 3),
+        (0, 1, 0),
+        (0, 1, 1),
+        (0, 1, 2),
+        (0, 1, 3),
+        (1, 0, 0),
+        (1, 0, 1),
+        (1, 0, 2),
+        (1, 0, 3),
+    ),
+    values=(0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 10.0, 11.0, 12.0, 13.0),
+    dense_shape=(2, 2, 4),
+)
+_STATIC_SHAPE_IDS_2D = tf.compat.v1.SparseTensorValue(
+    # example 0, ids [2]
+    # example 1, ids [0, 1]
+    # example 2, ids []
+    # example 3, ids [1]
+    indices=((0, 0), (1, 0), (1, 1), (3, 0)),
+    values=(2, 0, 1, 1),
+    dense_shape=(4, 2),
+)
+_STATIC_SHAPE_IDS_3D = tf.compat.v1.SparseTensorValue(
+    # example 0, ids [[2]]
+    # example 1, ids [[0, 1], [2]]
+    # example 2, ids []
+    # example 3, ids [[1], [0, 2]]
+    indices=(
+        (0, 0, 0),
+        (1, 0, 0),
+        (1, 0, 1),
+        (1, 1, 0),
+        (3, 0, 0),
+        (3, 1, 0),
+        (3, 1, 1),
+    ),
+    values=(2, 0, 1, 2, 1, 0, 2),
+    dense_shape=(4, 2, 2),
+)
+
+
 @test_combinations.generate(test_combinations.combine(mode=["graph", "eager"]))
 class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     @parameterized.named_parameters(
         {
             "testcase_name": "2D",
-            "sparse_input_args_a": {
-                # example 0, ids [2]
-                # example 1, ids [0, 1]
-                "indices": ((0, 0), (1, 0), (1, 1)),
-                "values": (2, 0, 1),
-                "dense_shape": (2, 2),
-            },
-            "sparse_input_args_b": {
-                # example 0, ids [1]
-                # example 1, ids [2, 0]
-                "indices": ((0, 0), (1, 0), (1, 1)),
-                "values": (1, 2, 0),
-                "dense_shape": (2, 2),
-            },
+            "sparse_input_a": _IDS_A_2D,
+            "sparse_input_b": _EMBEDDING_IDS_B_2D,
             "expected_input_layer": [
                 # example 0, ids_a [2], ids_b [1]
                 [[5.0, 6.0, 14.0, 15.0, 16.0], [0.0, 0.0, 0.0, 0.0, 0.0]],
@@ -66,33 +189,8 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
         },
         {
             "testcase_name": "3D",
-            "sparse_input_args_a": {
-                # feature 0, ids [[2], [0, 1]]
-                # feature 1, ids [[0, 0], [1]]
-                "indices": (
-                    (0, 0, 0),
-                    (0, 1, 0),
-                    (0, 1, 1),
-                    (1, 0, 0),
-                    (1, 0, 1),
-                    (1, 1, 0),
-                ),
-                "values": (2, 0, 1, 0, 0, 1),
-                "dense_shape": (2, 2, 2),
-            },
-            "sparse_input_args_b": {
-                # feature 0, ids [[1, 1], [1]]
-                # feature 1, ids [[2], [0]]
-                "indices": (
-                    (0, 0, 0),
-                    (0, 0, 1),
-                    (0, 1, 0),
-                    (1, 0, 0),
-                    (1, 1, 0),
-                ),
-                "values": (1, 1, 1, 2, 0),
-                "dense_shape": (2, 2, 2),
-            },
+            "sparse_input_a": _IDS_A_3D,
+            "sparse_input_b": _EMBEDDING_IDS_B_3D,
             "expected_input_layer": [
                 # feature 0, [a: 2, -, b: 1, 1], [a: 0, 1, b: 1, -]
                 [[5.0, 6.0, 14.0, 15.0, 16.0], [2.0, 3.0, 14.0, 15.0, 16.0]],
@@ -104,14 +202,12 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     )
     def test_embedding_column(
         self,
-        sparse_input_args_a,
-        sparse_input_args_b,
+        sparse_input_a,
+        sparse_input_b,
         expected_input_layer,
         expected_sequence_length,
     ):
 
-        sparse_input_a = tf.compat.v1.SparseTensorValue(**sparse_input_args_a)
-        sparse_input_b = tf.compat.v1.SparseTensorValue(**sparse_input_args_b)
         vocabulary_size = 3
         embedding_dimension_a = 2
         embedding_values_a = (
@@ -180,14 +276,15 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
                 "sequence_features/aaa_embedding/embedding_weights:0",
                 "sequence_features/bbb_embedding/embedding_weights:0",
             ),
-            tuple([v.name for v in weights]),
+            [v.name for v in weights],
         )
-        self.assertAllEqual(embedding_values_a, self.evaluate(weights[0]))
-        self.assertAllEqual(embedding_values_b, self.evaluate(weights[1]))
-        self.assertAllEqual(expected_input_layer, self.evaluate(input_layer))
-        self.assertAllEqual(
-            expected_sequence_length, self.evaluate(sequence_length)
+        weights_a, weights_b, input_layer_r, sequence_length_r = self.evaluate(
+            (weights[0], weights[1], input_layer, sequence_length)
         )
+        self.assertAllEqual(embedding_values_a, weights_a)
+        self.assertAllEqual(embedding_values_b, weights_b)
+        self.assertAllEqual(expected_input_layer, input_layer_r)
+        self.assertAllEqual(expected_sequence_length, sequence_length_r)
 
     def test_embedding_column_with_non_sequence_categorical(self):
         """Tests that error is raised for non-sequence embedding column."""
@@ -291,18 +388,15 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
             )
             self.assertCountEqual(
                 ("aaa_bbb_shared_embedding:0",),
-                tuple([v.name for v in global_vars]),
+                [v.name for v in global_vars],
             )
             with _initialized_session() as sess:
-                self.assertAllEqual(
-                    embedding_values, global_vars[0].eval(session=sess)
-                )
-                self.assertAllEqual(
-                    expected_input_layer, input_layer.eval(session=sess)
-                )
-                self.assertAllEqual(
-                    expected_sequence_length, sequence_length.eval(session=sess)
+                embedding_r, input_layer_r, sequence_length_r = sess.run(
+                    (global_vars[0], input_layer, sequence_length)
                 )
+            self.assertAllEqual(embedding_values, embedding_r)
+            self.assertAllEqual(expected_input_layer, input_layer_r)
+            self.assertAllEqual(expected_sequence_length, sequence_length_r)
 
     def test_shared_embedding_column_with_non_sequence_categorical(self):
         """Tests that error is raised for non-sequence shared embedding column."""
@@ -353,20 +447,8 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     @parameterized.named_parameters(
         {
             "testcase_name": "2D",
-            "sparse_input_args_a": {
-                # example 0, ids [2]
-                # example 1, ids [0, 1]
-                "indices": ((0, 0), (1, 0), (1, 1)),
-                "values": (2, 0, 1),
-                "dense_shape": (2, 2),
-            },
-            "sparse_input_args_b": {
-                # example 0, ids [1]
-                # example 1, ids [1, 0]
-                "indices": ((0, 0), (1, 0), (1, 1)),
-                "values": (1, 1, 0),
-                "dense_shape": (2, 2),
-            },
+            "sparse_input_a": _IDS_A_2D,
+            "sparse_input_b": _INDICATOR_IDS_B_2D,
             "expected_input_layer": [
                 # example 0, ids_a [2], ids_b [1]
                 [[0.0, 0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 0.0, 0.0, 0.0]],
@@ -377,33 +459,8 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
         },
         {
             "testcase_name": "3D",
-            "sparse_input_args_a": {
-                # feature 0, ids [[2], [0, 1]]
-                # feature 1, ids [[0, 0], [1]]
-                "indices": (
-                    (0, 0, 0),
-                    (0, 1, 0),
-                    (0, 1, 1),
-                    (1, 0, 0),
-                    (1, 0, 1),
-                    (1, 1, 0),
-                ),
-                "values": (2, 0, 1, 0, 0, 1),
-                "dense_shape": (2, 2, 2),
-            },
-            "sparse_input_args_b": {
-                # feature 0, ids [[1, 1], [1]]
-                # feature 1, ids [[1], [0]]
-                "indices": (
-                    (0, 0, 0),
-                    (0, 0, 1),
-                    (0, 1, 0),
-                    (1, 0, 0),
-                    (1, 1, 0),
-                ),
-                "values": (1, 1, 1, 1, 0),
-                "dense_shape": (2, 2, 2),
-            },
+            "sparse_input_a": _IDS_A_3D,
+            "sparse_input_b": _INDICATOR_IDS_B_3D,
             "expected_input_layer": [
                 # feature 0, [a: 2, -, b: 1, 1], [a: 0, 1, b: 1, -]
                 [[0.0, 0.0, 1.0, 0.0, 2.0], [1.0, 1.0, 0.0, 0.0, 1.0]],
@@ -415,13 +472,11 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     )
     def test_indicator_column(
         self,
-        sparse_input_args_a,
-        sparse_input_args_b,
+        sparse_input_a,
+        sparse_input_b,
         expected_input_layer,
         expected_sequence_length,
     ):
-        sparse_input_a = tf.compat.v1.SparseTensorValue(**sparse_input_args_a)
-        sparse_input_b = tf.compat.v1.SparseTensorValue(**sparse_input_args_b)
 
         vocabulary_size_a = 3
         vocabulary_size_b = 2
@@ -450,10 +505,11 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
             {"aaa": sparse_input_a, "bbb": sparse_input_b}
         )
 
-        self.assertAllEqual(expected_input_layer, self.evaluate(input_layer))
-        self.assertAllEqual(
-            expected_sequence_length, self.evaluate(sequence_length)
+        input_layer_r, sequence_length_r = self.evaluate(
+            (input_layer, sequence_length)
         )
+        self.assertAllEqual(expected_input_layer, input_layer_r)
+        self.assertAllEqual(expected_sequence_length, sequence_length_r)
 
     def test_indicator_column_with_non_sequence_categorical(self):
         """Tests that error is raised for non-sequence categorical column."""
@@ -486,31 +542,13 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     @parameterized.named_parameters(
         {
             "testcase_name": "2D",
-            "sparse_input_args": {
-                # example 0, values [0., 1]
-                # example 1, [10.]
-                "indices": ((0, 0), (0, 1), (1, 0)),
-                "values": (0.0, 1.0, 10.0),
-                "dense_shape": (2, 2),
-            },
+            "sparse_input": _NUMERIC_VALUES_2D,
             "expected_input_layer": [[[0.0], [1.0]], [[10.0], [0.0]]],
             "expected_sequence_length": [2, 1],
         },
         {
             "testcase_name": "3D",
-            "sparse_input_args": {
-                # feature 0, ids [[20, 3], [5]]
-                # feature 1, ids [[3], [8]]
-                "indices": (
-                    (0, 0, 0),
-                    (0, 0, 1),
-                    (0, 1, 0),
-                    (1, 0, 0),
-                    (1, 1, 0),
-                ),
-                "values": (20.0, 3.0, 5.0, 3.0, 8.0),
-                "dense_shape": (2, 2, 2),
-            },
+            "sparse_input": _NUMERIC_VALUES_3D,
             "expected_input_layer": [
                 [[20.0], [3.0], [5.0], [0.0]],
                 [[3.0], [0.0], [8.0], [0.0]],
@@ -519,9 +557,8 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
         },
     )
     def test_numeric_column(
-        self, sparse_input_args, expected_input_layer, expected_sequence_length
+        self, sparse_input, expected_input_layer, expected_sequence_length
     ):
-        sparse_input = tf.compat.v1.SparseTensorValue(**sparse_input_args)
 
         numeric_column = tf.feature_column.sequence_numeric_column("aaa")
 
@@ -530,47 +567,16 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
             {"aaa": sparse_input}
         )
 
-        self.assertAllEqual(expected_input_layer, self.evaluate(input_layer))
-        self.assertAllEqual(
-            expected_sequence_length, self.evaluate(sequence_length)
+        input_layer_r, sequence_length_r = self.evaluate(
+            (input_layer, sequence_length)
         )
+        self.assertAllEqual(expected_input_layer, input_layer_r)
+        self.assertAllEqual(expected_sequence_length, sequence_length_r)
 
     @parameterized.named_parameters(
         {
             "testcase_name": "2D",
-            "sparse_input_args": {
-                # example 0, values [0., 1.,  2., 3., 4., 5., 6., 7.]
-                # example 1, [10., 11., 12., 13.]
-                "indices": (
-                    (0, 0),
-                    (0, 1),
-                    (0, 2),
-                    (0, 3),
-                    (0, 4),
-                    (0, 5),
-                    (0, 6),
-                    (0, 7),
-                    (1, 0),
-                    (1, 1),
-                    (1, 2),
-                    (1, 3),
-                ),
-                "values": (
-                    0.0,
-                    1.0,
-                    2.0,
-                    3.0,
-                    4.0,
-                    5.0,
-                    6.0,
-                    7.0,
-                    10.0,
-                    11.0,
-                    12.0,
-                    13.0,
-                ),
-                "dense_shape": (2, 8),
-            },
+            "sparse_input": _NUMERIC_2X2_VALUES_2D,
             "expected_input_layer": [
                 # The output of numeric_column._get_dense_tensor should be flattened.
                 [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0]],
@@ -580,39 +586,7 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
         },
         {
             "testcase_name": "3D",
-            "sparse_input_args": {
-                # example 0, values [[0., 1., 2., 3.]], [[4., 5., 6., 7.]]
-                # example 1, [[10., 11., 12., 13.], []]
-                "indices": (
-                    (0, 0, 0),
-                    (0, 0, 1),
-                    (0, 0, 2),
-                    (0, 0, 3),
-                    (0, 1, 0),
-                    (0, 1, 1),
-                    (0, 1, 2),
-                    (0, 1, 3),
-                    (1, 0, 0),
-                    (1, 0, 1),
-                    (1, 0, 2),
-                    (1, 0, 3),
-                ),
-                "values": (
-                    0.0,
-                    1.0,
-                    2.0,
-                    3.0,
-                    4.0,
-                    5.0,
-                    6.0,
-                    7.0,
-                    10.0,
-                    11.0,
-                    12.0,
-                    13.0,
-                ),
-                "dense_shape": (2, 2, 4),
-            },
+            "sparse_input": _NUMERIC_2X2_VALUES_3D,
             "expected_input_layer": [
                 # The output of numeric_column._get_dense_tensor should be flattened.
                 [[0.0, 1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0]],
@@ -622,10 +596,9 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
         },
     )
     def test_numeric_column_multi_dim(
-        self, sparse_input_args, expected_input_layer, expected_sequence_length
+        self, sparse_input, expected_input_layer, expected_sequence_length
     ):
         """Tests SequenceFeatures for multi-dimensional numeric_column."""
-        sparse_input = tf.compat.v1.SparseTensorValue(**sparse_input_args)
 
         numeric_column = tf.feature_column.sequence_numeric_column(
             "aaa", shape=(2, 2)
@@ -636,10 +609,11 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
             {"aaa": sparse_input}
         )
 
-        self.assertAllEqual(expected_input_layer, self.evaluate(input_layer))
-        self.assertAllEqual(
-            expected_sequence_length, self.evaluate(sequence_length)
+        input_layer_r, sequence_length_r = self.evaluate(
+            (input_layer, sequence_length)
         )
+        self.assertAllEqual(expected_input_layer, input_layer_r)
+        self.assertAllEqual(expected_sequence_length, sequence_length_r)
 
     def test_sequence_length_not_equal(self):
         """Tests that an error is raised when sequence lengths are not equal."""
@@ -671,84 +645,19 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     @parameterized.named_parameters(
         {
             "testcase_name": "2D",
-            "sparse_input_args": {
-                # example 0, values [[[0., 1.],  [2., 3.]], [[4., 5.],  [6., 7.]]]
-                # example 1, [[[10., 11.],  [12., 13.]]]
-                "indices": (
-                    (0, 0),
-                    (0, 1),
-                    (0, 2),
-                    (0, 3),
-                    (0, 4),
-                    (0, 5),
-                    (0, 6),
-                    (0, 7),
-                    (1, 0),
-                    (1, 1),
-                    (1, 2),
-                    (1, 3),
-                ),
-                "values": (
-                    0.0,
-                    1.0,
-                    2.0,
-                    3.0,
-                    4.0,
-                    5.0,
-                    6.0,
-                    7.0,
-                    10.0,
-                    11.0,
-                    12.0,
-                    13.0,
-                ),
-                "dense_shape": (2, 8),
-            },
+            "sparse_input": _NUMERIC_2X2_VALUES_2D,
             "expected_shape": [2, 2, 4],
         },
         {
             "testcase_name": "3D",
-            "sparse_input_args": {
-                # example 0, values [[0., 1., 2., 3.]], [[4., 5., 6., 7.]]
-                # example 1, [[10., 11., 12., 13.], []]
-                "indices": (
-                    (0, 0, 0),
-                    (0, 0, 1),
-                    (0, 0, 2),
-                    (0, 0, 3),
-                    (0, 1, 0),
-                    (0, 1, 1),
-                    (0, 1, 2),
-                    (0, 1, 3),
-                    (1, 0, 0),
-                    (1, 0, 1),
-                    (1, 0, 2),
-                    (1, 0, 3),
-                ),
-                "values": (
-                    0.0,
-                    1.0,
-                    2.0,
-                    3.0,
-                    4.0,
-                    5.0,
-                    6.0,
-                    7.0,
-                    10.0,
-                    11.0,
-                    12.0,
-                    13.0,
-                ),
-                "dense_shape": (2, 2, 4),
-            },
+            "sparse_input": _NUMERIC_2X2_VALUES_3D,
             "expected_shape": [2, 2, 4],
         },
     )
     def test_static_shape_from_tensors_numeric(
-        self, sparse_input_args, expected_shape
+        self, sparse_input, expected_shape
     ):
         """Tests that we return a known static shape when we have one."""
-        sparse_input = tf.compat.v1.SparseTensorValue(**sparse_input_args)
         numeric_column = tf.feature_column.sequence_numeric_column(
             "aaa", shape=(2, 2)
         )
@@ -761,44 +670,19 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
     @parameterized.named_parameters(
         {
             "testcase_name": "2D",
-            "sparse_input_args": {
-                # example 0, ids [2]
-                # example 1, ids [0, 1]
-                # example 2, ids []
-                # example 3, ids [1]
-                "indices": ((0, 0), (1, 0), (1, 1), (3, 0)),
-                "values": (2, 0, 1, 1),
-                "dense_shape": (4, 2),
-            },
+            "sparse_input": _STATIC_SHAPE_IDS_2D,
             "expected_shape": [4, 2, 3],
         },
         {
             "testcase_name": "3D",
-            "sparse_input_args": {
-                # example 0, ids [[2]]
-                # example 1, ids [[0, 1], [2]]
-                # example 2, ids []
-                # example 3, ids [[1], [0, 2]]
-                "indices": (
-                    (0, 0, 0),
-                    (1, 0, 0),
-                    (1, 0, 1),
-                    (1, 1, 0),
-                    (3, 0, 0),
-                    (3, 1, 0),
-                    (3, 1, 1),
-                ),
-                "values": (2, 0, 1, 2, 1, 0, 2),
-                "dense_shape": (4, 2, 2),
-            },
+            "sparse_input": _STATIC_SHAPE_IDS_3D,
             "expected_shape": [4, 2, 3],
         },
     )
     def test_static_shape_from_tensors_indicator(
-        self, sparse_input_args, expected_shape
+        self, sparse_input, expected_shape
     ):
         """Tests that we return a known static shape when we have one."""
-        sparse_input = tf.compat.v1.SparseTensorValue(**sparse_input_args)
         categorical_column = (
             tf.feature_column.sequence_categorical_column_with_identity(
                 key="aaa", num_buckets=3
@@ -859,6 +743,7 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
         self.evaluate(tf.compat.v1.global_variables_initializer())
         self.evaluate(tf.compat.v1.tables_initializer())
 
+        seq_input_r, seq_len_r = self.evaluate((seq_input, seq_len))
         self.assertAllClose(
             [
                 [[0.0, 1.0, 10.0], [10.0, 11.0, 11.0], [0.0, 0.0, 0.0]],
@@ -866,9 +751,9 @@ class SequenceFeaturesTest(tf.test.TestCase, parameterized.TestCase):
                 [[200.0, 201.0, 30.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
                 [[300.0, 301.0, 40.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
             ],
-            self.evaluate(seq_input),
+            seq_input_r,
         )
-        self.assertAllClose([2, 1, 1, 1], self.evaluate(seq_len))
+        self.assertAllClose([2, 1, 1, 1], seq_len_r)
 
 
 @test_combinations.generate(test_combinations.combine(mode=["graph", "eager"]))